@@ -1,13 +1,13 @@
 import math
 import numpy as np
-from PySide6.QtCore import Signal
+from PySide6.QtCore import QSignalBlocker, Signal
 from PySide6.QtWidgets import QWidget, QVBoxLayout
 
 from .components import PowerOfTwoSpinBox
 from .logic import (
     determine_dtype_defaults,
     get_dtype_defaults,
-    round_to_power_of_2,
+    nearest_power_of_2_log2,
     format_value_label,
     format_gain_label,
     clamp_value,
@@ -42,6 +42,11 @@ class BrightnessTab(QWidget):
         self.offset_range = defaults["offset_range"]
         self.gain_range = defaults["gain_range"]
         self.saturation_range = defaults["saturation_range"]
+        self.offset_slider_range = defaults["offset_slider_range"]
+        self.offset_slider_tick = defaults["offset_slider_tick"]
+        self.saturation_slider_range = defaults["saturation_slider_range"]
+        self.saturation_slider_tick = defaults["saturation_slider_tick"]
+        self.saturation_slider_scale = defaults["saturation_slider_scale"]
 
         # Extended ranges for controls
         self._gain_log2_min = -7  # 2^-7 = 1/128
@@ -62,7 +67,7 @@ class BrightnessTab(QWidget):
         main_layout.setSpacing(20)
         main_layout.setContentsMargins(25, 25, 25, 25)
 
-        builder = BrightnessUIBuilder(self)
+        builder = self._builder = BrightnessUIBuilder(self)
 
         # Dtype selector
         self.dtype_combo = builder.build_dtype_selector(main_layout, self.current_dtype, self._on_dtype_changed)
@@ -75,6 +80,8 @@ class BrightnessTab(QWidget):
             self.is_float_type,
             self._on_offset_slider_changed,
             self._on_offset_spinbox_changed,
+            self.offset_slider_range,
+            self.offset_slider_tick,
         )
 
         # Gain controls
@@ -101,6 +108,8 @@ class BrightnessTab(QWidget):
             self.is_float_type,
             self._on_saturation_slider_changed,
             self._on_saturation_spinbox_changed,
+            self.saturation_slider_range,
+            self.saturation_slider_tick,
         )
 
         # Formula and reset button
@@ -109,27 +118,24 @@ class BrightnessTab(QWidget):
     # ------------------------ Slot handlers ------------------------
     def _on_offset_slider_changed(self, value):
         actual_value = value / 10.0
-        self.offset_spinbox.blockSignals(True)
-        self.offset_spinbox.setValue(actual_value)
-        self.offset_spinbox.blockSignals(False)
+        with QSignalBlocker(self.offset_spinbox):
+            self.offset_spinbox.setValue(actual_value)
         self._update_offset_label(actual_value)
         self._save_current_params()
         self._emit_brightness_changed()
 
     def _on_offset_spinbox_changed(self, value):
-        self.offset_slider.blockSignals(True)
-        self.offset_slider.setValue(int(value * 10))
-        self.offset_slider.blockSignals(False)
+        with QSignalBlocker(self.offset_slider):
+            self.offset_slider.setValue(int(value * 10))
         self._update_offset_label(value)
         self._save_current_params()
         self._emit_brightness_changed()
 
     def _on_gain_slider_changed(self, value):
         # Slider value is log2, convert to actual gain (power of 2)
-        actual_value = 2**value
-        self.gain_spinbox.blockSignals(True)
-        self.gain_spinbox.setValue(actual_value)
-        self.gain_spinbox.blockSignals(False)
+        actual_value = math.ldexp(1.0, value)
+        with QSignalBlocker(self.gain_spinbox):
+            self.gain_spinbox.setValue(actual_value)
         self._update_gain_label(actual_value)
         self._save_current_params()
         self._emit_brightness_changed()
@@ -137,17 +143,19 @@ class BrightnessTab(QWidget):
     def _on_gain_spinbox_changed(self, value):
         # Round to nearest power of 2
         if value > 0:
-            rounded = round_to_power_of_2(value, self._gain_log2_min, self._gain_log2_max)
-            log2_value = int(round(math.log2(rounded)))
+            log2_value = nearest_power_of_2_log2(value, self._gain_log2_min, self._gain_log2_max)
+            rounded = math.ldexp(1.0, log2_value)
 
             # Update spinbox and slider
-            self.gain_spinbox.blockSignals(True)
-            self.gain_spinbox.setValue(rounded)
-            self.gain_spinbox.blockSignals(False)
+            with QSignalBlocker(self.gain_spinbox):
+                self.gain_spinbox.setValue(rounded)
 
-            self.gain_slider.blockSignals(True)
-            self.gain_slider.setValue(log2_value)
-            self.gain_slider.blockSignals(False)
+            # Slider already holds this exponent: the gain did not change
+            if log2_value == self.gain_slider.value():
+                return
+
+            with QSignalBlocker(self.gain_slider):
+                self.gain_slider.setValue(log2_value)
 
             self._update_gain_label(rounded)
             self._save_current_params()
@@ -157,18 +165,16 @@ class BrightnessTab(QWidget):
             self._reset_gain_to_default()
 
     def _on_saturation_slider_changed(self, value):
-        actual_value = value / 1000.0 if self.is_float_type else value
-        self.saturation_spinbox.blockSignals(True)
-        self.saturation_spinbox.setValue(actual_value)
-        self.saturation_spinbox.blockSignals(False)
+        actual_value = value / self.saturation_slider_scale
+        with QSignalBlocker(self.saturation_spinbox):
+            self.saturation_spinbox.setValue(actual_value)
         self._update_saturation_label(actual_value)
         self._save_current_params()
         self._emit_brightness_changed()
 
     def _on_saturation_spinbox_changed(self, value):
-        self.saturation_slider.blockSignals(True)
-        self.saturation_slider.setValue(int(value * 1000) if self.is_float_type else int(value))
-        self.saturation_slider.blockSignals(False)
+        with QSignalBlocker(self.saturation_slider):
+            self.saturation_slider.setValue(int(value * self.saturation_slider_scale))
         self._update_saturation_label(value)
         self._save_current_params()
         self._emit_brightness_changed()
@@ -179,13 +185,12 @@ class BrightnessTab(QWidget):
     def _on_dtype_changed(self, dtype_text):
         """Handle manual dtype selection from combo box."""
         # Save current params for the old dtype
-        prev_dtype = self.current_dtype
         prev_params = (
             self.offset_spinbox.value(),
             self.gain_spinbox.value(),
             self.saturation_spinbox.value(),
         )
-        self._save_current_params()
+        self.dtype_params[self.current_dtype] = prev_params
 
         # Switch to new dtype and update ranges/widgets
         self.current_dtype = dtype_text
@@ -195,13 +200,9 @@ class BrightnessTab(QWidget):
         self._configure_saturation_widgets()
 
         # Prefer using saved params for the new dtype; if none, carry over previous params
-        if dtype_text in self.dtype_params:
-            offset, gain, saturation = self.dtype_params[dtype_text]
-        else:
-            offset, gain, saturation = prev_params
+        offset, gain, saturation = self.dtype_params.get(dtype_text, prev_params)
 
-        clamped_offset, clamped_gain, clamped_sat = self._apply_values(offset, gain, saturation, clamp=True)
-        self.dtype_params[self.current_dtype] = (clamped_offset, clamped_gain, clamped_sat)
+        self.dtype_params[dtype_text] = self._apply_values(offset, gain, saturation, clamp=True)
         self._emit_brightness_changed()
 
     # ------------------------ Label updates ------------------------
@@ -221,6 +222,11 @@ class BrightnessTab(QWidget):
         self.is_float_type = defaults["is_float_type"]
         self.offset_range = defaults["offset_range"]
         self.saturation_range = defaults["saturation_range"]
+        self.offset_slider_range = defaults["offset_slider_range"]
+        self.offset_slider_tick = defaults["offset_slider_tick"]
+        self.saturation_slider_range = defaults["saturation_slider_range"]
+        self.saturation_slider_tick = defaults["saturation_slider_tick"]
+        self.saturation_slider_scale = defaults["saturation_slider_scale"]
         self.gain_range = defaults["gain_range"]
 
     def _get_params_for_dtype(self, dtype_key):
@@ -231,45 +237,38 @@ class BrightnessTab(QWidget):
         return (defaults["initial_offset"], defaults["initial_gain"], defaults["initial_saturation"])
 
     def _configure_offset_widgets(self):
-        self.offset_slider.blockSignals(True)
-        self.offset_slider.setRange(int(self.offset_range[0] * 10), int(self.offset_range[1] * 10))
-        self.offset_slider.blockSignals(False)
-        self.offset_spinbox.blockSignals(True)
-        self.offset_spinbox.setRange(self.offset_range[0], self.offset_range[1])
-        if self.is_float_type:
-            self.offset_spinbox.setDecimals(5)
-            self.offset_spinbox.setSingleStep(0.01)
-        else:
-            self.offset_spinbox.setDecimals(0)
-            self.offset_spinbox.setSingleStep(1)
-        self.offset_spinbox.blockSignals(False)
+        with QSignalBlocker(self.offset_slider):
+            self.offset_slider.setRange(*self.offset_slider_range)
+            self.offset_slider.setTickInterval(self.offset_slider_tick)
+        with QSignalBlocker(self.offset_spinbox):
+            self.offset_spinbox.setRange(self.offset_range[0], self.offset_range[1])
+            if self.is_float_type:
+                self.offset_spinbox.setDecimals(5)
+                self.offset_spinbox.setSingleStep(0.01)
+            else:
+                self.offset_spinbox.setDecimals(0)
+                self.offset_spinbox.setSingleStep(1)
 
     def _configure_saturation_widgets(self):
-        self.saturation_slider.blockSignals(True)
-        if self.is_float_type:
-            self.saturation_slider.setRange(int(self.saturation_range[0] * 1000), int(self.saturation_range[1] * 1000))
-        else:
-            self.saturation_slider.setRange(self.saturation_range[0], self.saturation_range[1])
-        self.saturation_slider.blockSignals(False)
-        self.saturation_spinbox.blockSignals(True)
-        self.saturation_spinbox.setRange(self.saturation_range[0], self.saturation_range[1])
-        if self.is_float_type:
-            self.saturation_spinbox.setDecimals(5)
-            self.saturation_spinbox.setSingleStep(0.01)
-        else:
-            self.saturation_spinbox.setDecimals(0)
-            self.saturation_spinbox.setSingleStep(1)
-        self.saturation_spinbox.blockSignals(False)
+        with QSignalBlocker(self.saturation_slider):
+            self.saturation_slider.setRange(*self.saturation_slider_range)
+            self.saturation_slider.setTickInterval(self.saturation_slider_tick)
+        with QSignalBlocker(self.saturation_spinbox):
+            self.saturation_spinbox.setRange(self.saturation_range[0], self.saturation_range[1])
+            if self.is_float_type:
+                self.saturation_spinbox.setDecimals(5)
+                self.saturation_spinbox.setSingleStep(0.01)
+            else:
+                self.saturation_spinbox.setDecimals(0)
+                self.saturation_spinbox.setSingleStep(1)
 
     def _configure_gain_widgets(self):
         """Configure gain slider/spinbox ranges."""
-        self.gain_slider.blockSignals(True)
-        self.gain_slider.setRange(self._gain_log2_min, self._gain_log2_max)
-        self.gain_slider.blockSignals(False)
+        with QSignalBlocker(self.gain_slider):
+            self.gain_slider.setRange(self._gain_log2_min, self._gain_log2_max)
 
-        self.gain_spinbox.blockSignals(True)
-        self.gain_spinbox.setRange(self._gain_spinbox_min, self._gain_spinbox_max)
-        self.gain_spinbox.blockSignals(False)
+        with QSignalBlocker(self.gain_spinbox):
+            self.gain_spinbox.setRange(self._gain_spinbox_min, self._gain_spinbox_max)
 
     def _apply_values(self, offset, gain, saturation, clamp=True):
         """Apply values to all widgets, optionally clamping them to valid ranges.
@@ -280,41 +279,54 @@ class BrightnessTab(QWidget):
         if clamp:
             offset = clamp_value(offset, self.offset_range[0], self.offset_range[1])
             gain = clamp_value(gain, self._gain_spinbox_min, self._gain_spinbox_max)
-            gain = round_to_power_of_2(gain, self._gain_log2_min, self._gain_log2_max)
             saturation = clamp_value(saturation, self.saturation_range[0], self.saturation_range[1])
-        else:
-            gain = round_to_power_of_2(gain, self._gain_log2_min, self._gain_log2_max)
 
-        gain_log2 = int(round(math.log2(gain)))
+        gain = math.ldexp(1.0, nearest_power_of_2_log2(gain, self._gain_log2_min, self._gain_log2_max))
+        self._write_widgets(offset, gain, saturation)
+
+        return offset, gain, saturation
+
+    def _value_widgets(self):
+        """Return the slider and spinbox widgets that hold brightness values."""
+        return (
+            self.offset_slider,
+            self.offset_spinbox,
+            self.gain_slider,
+            self.gain_spinbox,
+            self.saturation_slider,
+            self.saturation_spinbox,
+        )
+
+    def _write_widgets(self, offset, gain, saturation):
+        """Write already clamped values to all widgets and labels without emitting signals.
+
+        Args:
+            offset: Offset value
+            gain: Gain value (exact power of 2)
+            saturation: Saturation value
+        """
+        # Exponent of an exact power of 2, without a log2 call
+        gain_log2 = math.frexp(gain)[1] - 1
+
+        # Signals are blocked below, so a throttled drag value would otherwise be
+        # delivered afterwards and overwrite these values.
+        self._builder.discard_pending()
+
+        blockers = [QSignalBlocker(widget) for widget in self._value_widgets()]
 
-        # Offset
-        self.offset_slider.blockSignals(True)
-        self.offset_spinbox.blockSignals(True)
         self.offset_spinbox.setValue(offset)
         self.offset_slider.setValue(int(offset * 10))
-        self._update_offset_label(offset)
-        self.offset_slider.blockSignals(False)
-        self.offset_spinbox.blockSignals(False)
-
-        # Gain
-        self.gain_slider.blockSignals(True)
-        self.gain_spinbox.blockSignals(True)
         self.gain_spinbox.setValue(gain)
         self.gain_slider.setValue(gain_log2)
-        self._update_gain_label(gain)
-        self.gain_slider.blockSignals(False)
-        self.gain_spinbox.blockSignals(False)
-
-        # Saturation
-        self.saturation_slider.blockSignals(True)
-        self.saturation_spinbox.blockSignals(True)
         self.saturation_spinbox.setValue(saturation)
-        self.saturation_slider.setValue(int(saturation * 1000) if self.is_float_type else int(saturation))
-        self._update_saturation_label(saturation)
-        self.saturation_slider.blockSignals(False)
-        self.saturation_spinbox.blockSignals(False)
+        self.saturation_slider.setValue(int(saturation * self.saturation_slider_scale))
 
-        return offset, gain, saturation
+        for blocker in blockers:
+            blocker.unblock()
+
+        self._update_offset_label(offset)
+        self._update_gain_label(gain)
+        self._update_saturation_label(saturation)
 
     # ------------------------ State management ------------------------
     def _save_current_params(self):
@@ -341,13 +353,11 @@ class BrightnessTab(QWidget):
 
     def _reset_gain_to_default(self):
         """Reset gain to 1.0 when invalid value entered."""
-        self.gain_spinbox.blockSignals(True)
-        self.gain_spinbox.setValue(1.0)
-        self.gain_spinbox.blockSignals(False)
+        with QSignalBlocker(self.gain_spinbox):
+            self.gain_spinbox.setValue(1.0)
 
-        self.gain_slider.blockSignals(True)
-        self.gain_slider.setValue(0)
-        self.gain_slider.blockSignals(False)
+        with QSignalBlocker(self.gain_slider):
+            self.gain_slider.setValue(0)
 
         self._update_gain_label(1.0)
         self._save_current_params()
@@ -368,60 +378,26 @@ class BrightnessTab(QWidget):
         Args:
             gain_value: Desired gain value (will be rounded to power of 2)
         """
-        rounded = round_to_power_of_2(gain_value, self._gain_log2_min, self._gain_log2_max)
-        log2_value = int(round(math.log2(rounded)))
-
-        self.gain_slider.blockSignals(True)
-        self.gain_spinbox.blockSignals(True)
-        self.gain_spinbox.setValue(rounded)
-        self.gain_slider.setValue(log2_value)
-        self._update_gain_label(rounded)
-        self.gain_slider.blockSignals(False)
-        self.gain_spinbox.blockSignals(False)
+        log2_value = nearest_power_of_2_log2(gain_value, self._gain_log2_min, self._gain_log2_max)
+        rounded = math.ldexp(1.0, log2_value)
+
+        with QSignalBlocker(self.gain_slider), QSignalBlocker(self.gain_spinbox):
+            self.gain_spinbox.setValue(rounded)
+            self.gain_slider.setValue(log2_value)
+            self._update_gain_label(rounded)
         self._save_current_params()
         self._emit_brightness_changed()
 
     def reset_parameters(self):
         """Reset all parameters to initial values."""
         self._reset_to_initial()
-        self._save_current_params()
         self._emit_brightness_changed()
 
     def _reset_to_initial(self):
         """Reset widgets to initial values."""
-        rounded_gain = round_to_power_of_2(self.initial_gain, self._gain_log2_min, self._gain_log2_max)
-        gain_log2 = int(round(math.log2(rounded_gain)))
-
-        # Offset
-        self.offset_slider.blockSignals(True)
-        self.offset_spinbox.blockSignals(True)
-        self.offset_spinbox.setValue(self.initial_offset)
-        self.offset_slider.setValue(int(self.initial_offset * 10))
-        self._update_offset_label(self.initial_offset)
-        self.offset_slider.blockSignals(False)
-        self.offset_spinbox.blockSignals(False)
-
-        # Gain
-        self.gain_slider.blockSignals(True)
-        self.gain_spinbox.blockSignals(True)
-        self.gain_spinbox.setValue(rounded_gain)
-        self.gain_slider.setValue(gain_log2)
-        self._update_gain_label(rounded_gain)
-        self.gain_slider.blockSignals(False)
-        self.gain_spinbox.blockSignals(False)
-
-        # Saturation
-        self.saturation_slider.blockSignals(True)
-        self.saturation_spinbox.blockSignals(True)
-        self.saturation_spinbox.setValue(self.initial_saturation)
-        self.saturation_slider.setValue(
-            int(self.initial_saturation * 1000) if self.is_float_type else int(self.initial_saturation)
+        self.dtype_params[self.current_dtype] = self._apply_values(
+            self.initial_offset, self.initial_gain, self.initial_saturation, clamp=False
         )
-        self._update_saturation_label(self.initial_saturation)
-        self.saturation_slider.blockSignals(False)
-        self.saturation_spinbox.blockSignals(False)
-
-        self.dtype_params[self.current_dtype] = (self.initial_offset, rounded_gain, self.initial_saturation)
 
     def get_parameters(self):
         """Get current brightness parameters.
@@ -464,34 +440,32 @@ class BrightnessTab(QWidget):
         self.offset_range = defaults["offset_range"]
         self.gain_range = defaults["gain_range"]
         self.saturation_range = defaults["saturation_range"]
-
-        if keep_settings:
-            self.dtype_params[old_dtype] = old_params
+        self.offset_slider_range = defaults["offset_slider_range"]
+        self.offset_slider_tick = defaults["offset_slider_tick"]
+        self.saturation_slider_range = defaults["saturation_slider_range"]
+        self.saturation_slider_tick = defaults["saturation_slider_tick"]
+        self.saturation_slider_scale = defaults["saturation_slider_scale"]
 
         # Update dtype combo
         if hasattr(self, "dtype_combo"):
-            self.dtype_combo.blockSignals(True)
-            self.dtype_combo.setCurrentText(self.current_dtype)
-            self.dtype_combo.blockSignals(False)
-
-        # Determine values to use
-        if keep_settings and self.current_dtype in self.dtype_params:
-            new_offset, new_gain, new_saturation = self.dtype_params[self.current_dtype]
-        else:
-            new_offset = self.initial_offset
-            new_gain = self.initial_gain
-            new_saturation = self.initial_saturation
+            with QSignalBlocker(self.dtype_combo):
+                self.dtype_combo.setCurrentText(self.current_dtype)
 
         # Reconfigure widgets
         self._configure_offset_widgets()
         self._configure_gain_widgets()
         self._configure_saturation_widgets()
 
-        # Apply values
-        clamped_offset, clamped_gain, clamped_sat = self._apply_values(new_offset, new_gain, new_saturation, clamp=True)
-        self.dtype_params[self.current_dtype] = (clamped_offset, clamped_gain, clamped_sat)
-        self._emit_brightness_changed()
-
-        if not keep_settings:
+        # Apply saved values for the new dtype, or reset to its defaults
+        if keep_settings:
+            if self.current_dtype == old_dtype:
+                new_offset, new_gain, new_saturation = old_params
+            else:
+                # Keep the outgoing dtype's params for when it comes back
+                self.dtype_params[old_dtype] = old_params
+                initial_params = (self.initial_offset, self.initial_gain, self.initial_saturation)
+                new_offset, new_gain, new_saturation = self.dtype_params.get(self.current_dtype, initial_params)
+            self.dtype_params[self.current_dtype] = self._apply_values(new_offset, new_gain, new_saturation, clamp=True)
+        else:
             self._reset_to_initial()
-            self._emit_brightness_changed()
+        self._emit_brightness_changed()
@@ -1,4 +1,7 @@
-from PySide6.QtCore import Signal, Qt
+from collections import OrderedDict
+from functools import lru_cache
+
+from PySide6.QtCore import Signal, Qt, QTimer, QSignalBlocker, QSize
 from PySide6.QtWidgets import (
     QWidget,
     QVBoxLayout,
@@ -8,17 +11,32 @@ from PySide6.QtWidgets import (
     QLabel,
     QCheckBox,
     QPushButton,
-    QColorDialog,
     QRadioButton,
     QButtonGroup,
 )
 from PySide6.QtGui import QColor, QPixmap, QIcon
-from ....utils import (
-    get_default_channel_colors,
-    colorbar_jet,
-    colorbar_flow_hsv,
-)
-from PixelScopeViewer.core.image_io import numpy_to_qimage
+from ....utils import get_default_channel_colors
+
+# Qt 6.7+ provides checkStateChanged; stateChanged(int) is its deprecated compat signal
+_HAS_CHECK_STATE_CHANGED = hasattr(QCheckBox, "checkStateChanged")
+
+
+@lru_cache(maxsize=64)
+def _cached_default_colors(n_channels):
+    """Return default channel colors for n_channels as a shared tuple.
+
+    The QColor objects are only copied by reference into channel lists and
+    never modified in place, so sharing them is safe.
+    """
+    return tuple(get_default_channel_colors(n_channels))
+
+
+@lru_cache(maxsize=1024)
+def _format_colorbar_label(value):
+    """Format a colorbar caption: integers without decimals, others with 3 decimals."""
+    if abs(value - round(value)) < 1e-6:
+        return str(int(round(value)))
+    return f"{value:.3f}"
 
 
 class ChannelTab(QWidget):
@@ -29,6 +47,15 @@ class ChannelTab(QWidget):
     mode_1ch_changed = Signal(str)  # "grayscale" or "jet"
     mode_2ch_changed = Signal(str)  # "composite" or "flow-hsv"
 
+    # Maximum number of rendered colorbar pixmaps kept per tab
+    COLORBAR_CACHE_SIZE = 32
+    # Brightness updates arriving within this interval (ms) share one colorbar refresh
+    COLORBAR_REFRESH_INTERVAL_MS = 16
+
+    # Color swatch icons shared by all tabs, keyed by QColor.rgba()
+    _ICON_CACHE = {}
+    ICON_CACHE_SIZE = 256
+
     def __init__(
         self,
         parent=None,
@@ -44,13 +71,32 @@ class ChannelTab(QWidget):
         self.checkboxes = []
         self.color_buttons = []
         self.channel_colors = []
+        # Pool of channel row widgets: [(row_widget, checkbox, color_button)], reused across images
+        self._channel_rows = []
+        self._no_channel_label = None
+        self._channel_group = None
+        self._suspend_emit = False  # set during bulk programmatic updates to coalesce emits
+        self._shape_sig = None  # (ndim, n_channels) of the image the rows were built for
         self._mode1 = initial_mode_1ch or "grayscale"
         self._mode2 = initial_mode_2ch or "flow-hsv"  # Default to flow-hsv for 2ch
         self._colorbar_label = None
         self._mode_group_box = None
         self._mode_layout = None
         self._mode_controls_layout = None
+        self._mode_built_for = None  # "1ch", "2ch" or "hidden" once built
+        self._mode_radios = {}  # mode name -> QRadioButton
+        self._mode_by_id = {}  # button id in _mode_button_group -> mode name
+        # Single exclusive group reused for every set of mode radios
+        self._mode_button_group = QButtonGroup(self)
+        self._mode_button_group.idToggled.connect(self._on_mode_group_toggled)
         self._last_brightness = None  # (offset, gain, saturation)
+        self._colorbar_cache = OrderedDict()  # (kind, min_label, max_label) -> scaled QPixmap
+        self._colorbar_label_key = ()  # cache key of the colorbar currently shown (None = cleared, () = never set)
+        # Coalesces bursts of brightness changes (slider drags) into one colorbar refresh
+        self._colorbar_timer = QTimer(self)
+        self._colorbar_timer.setSingleShot(True)
+        self._colorbar_timer.setInterval(self.COLORBAR_REFRESH_INTERVAL_MS)
+        self._colorbar_timer.timeout.connect(self._update_colorbar)
         self._setup_ui(initial_channels, initial_colors)
 
     # ---------- UI helpers ----------
@@ -59,55 +105,137 @@ class ChannelTab(QWidget):
 
         If given is shorter than n, pad with default colors; if longer, truncate.
         """
+        default_colors = _cached_default_colors(n_channels)
         if given is not None and len(given) > 0:
             # Use given colors, and extend with default colors for missing channels
-            default_colors = get_default_channel_colors(n_channels)
             return [given[i] if i < len(given) else default_colors[i] for i in range(n_channels)]
 
-        return get_default_channel_colors(n_channels)
+        return list(default_colors)
 
     def _update_color_button(self, button, color):
-        pixmap = QPixmap(48, 16)
-        pixmap.fill(color)
-        button.setIcon(QIcon(pixmap))
-        button.setStyleSheet(f"background-color: {color.name()}; border: 1px solid #999;")
-        button.setText("")
+        key = color.rgba()
+        icon = self._ICON_CACHE.get(key)
+        if icon is None:
+            pixmap = QPixmap(48, 16)
+            pixmap.fill(color)
+            icon = QIcon(pixmap)
+            if len(self._ICON_CACHE) >= self.ICON_CACHE_SIZE:
+                # Drop the oldest entry (dicts keep insertion order)
+                del self._ICON_CACHE[next(iter(self._ICON_CACHE))]
+            self._ICON_CACHE[key] = icon
+        button.setIcon(icon)
 
     def _emit_change(self):
+        if self._suspend_emit:
+            return
         states = [cb.isChecked() for cb in self.checkboxes]
         self.channels_changed.emit(states)
 
     def _emit_color_change(self):
+        if self._suspend_emit:
+            return
         self.channel_colors_changed.emit(self.channel_colors)
 
-    def _make_channel_row(self, i, checked, color):
-        row = QHBoxLayout()
+    def _make_channel_row(self, i):
+        """Create the pooled row widget for channel i.
+
+        Returns:
+            tuple: (row_widget, checkbox, color_button)
+        """
+        row_widget = QWidget()
+        row = QHBoxLayout(row_widget)
+        row.setContentsMargins(0, 0, 0, 0)
         cb = QCheckBox(f"チャンネル {i} (Channel {i})")
-        cb.setChecked(checked)
-        cb.stateChanged.connect(self._on_channel_changed)
-        self.checkboxes.append(cb)
+        if _HAS_CHECK_STATE_CHANGED:
+            cb.checkStateChanged.connect(self._on_channel_changed)
+        else:
+            cb.stateChanged.connect(self._on_channel_changed)
         row.addWidget(cb)
 
         color_button = QPushButton()
         color_button.setFixedSize(60, 24)
+        # Styled once; color changes only swap the swatch icon
+        color_button.setStyleSheet("border: 1px solid #999;")
+        color_button.setIconSize(QSize(48, 16))
         color_button.setToolTip("クリックして色を選択 (Click to select color)")
-        self._update_color_button(color_button, color)
-        color_button.clicked.connect(lambda checked=False, idx=i: self._select_color(idx))
-        self.color_buttons.append(color_button)
-        self.channel_colors.append(color)
+        color_button.setProperty("channel_idx", i)
+        color_button.clicked.connect(self._on_color_button_clicked)
         row.addWidget(color_button)
         row.addStretch()
-        return row
+        return row_widget, cb, color_button
+
+    def _populate_channel_rows(self, layout, checks, colors):
+        """Show one row per entry in checks/colors, reusing pooled row widgets.
+
+        Only missing rows are created; rows beyond the channel count are
+        hidden rather than deleted.
+        """
+        n_channels = len(checks)
+        self.checkboxes.clear()
+        self.color_buttons.clear()
+        self.channel_colors.clear()
+
+        for i in range(n_channels):
+            if i >= len(self._channel_rows):
+                self._channel_rows.append(self._make_channel_row(i))
+                layout.addWidget(self._channel_rows[i][0])
+            row_widget, cb, color_button = self._channel_rows[i]
+
+            with QSignalBlocker(cb):
+                cb.setChecked(checks[i])
+            color = colors[i]
+            self._update_color_button(color_button, color)
+            row_widget.setVisible(True)
+
+            self.checkboxes.append(cb)
+            self.color_buttons.append(color_button)
+            self.channel_colors.append(color)
+
+        for row_widget, _, _ in self._channel_rows[n_channels:]:
+            row_widget.setVisible(False)
+
+        if self._no_channel_label is None:
+            self._no_channel_label = QLabel("チャンネル選択なし (グレースケール画像)")
+            self._no_channel_label.setStyleSheet("color: #888;")
+            layout.insertWidget(0, self._no_channel_label)
+        self._no_channel_label.setVisible(n_channels == 0)
+
+    def _resolve_channel_state(self, n_channels, channel_checks=None, channel_colors=None):
+        """Return (checks, colors) lists of length n_channels, filling gaps with defaults."""
+        checks = [
+            bool(channel_checks[i]) if channel_checks and i < len(channel_checks) else True for i in range(n_channels)
+        ]
+        colors = self._default_colors(n_channels, channel_colors) if n_channels > 0 else []
+        return checks, colors
+
+    def _channel_state_matches(self, checks, colors):
+        """Return True if the shown rows already have exactly these checks and colors."""
+        return checks == self.get_channel_states() and [c.rgba() for c in colors] == [
+            c.rgba() for c in self.channel_colors
+        ]
+
+    @staticmethod
+    def _channel_count(image_array):
+        """Return the number of selectable channels (0 for grayscale or no image)."""
+        if image_array is not None and getattr(image_array, "ndim", 0) >= 3:
+            return image_array.shape[2]
+        return 0
 
     def _clear_layout(self, layout):
-        while layout.count():
-            item = layout.takeAt(0)
-            w = item.widget()
-            if w:
-                w.setParent(None)
-                w.deleteLater()
-            elif item.layout():
-                self._clear_layout(item.layout())
+        """Remove all widgets from layout (and nested layouts), deleting them in one batch."""
+        # Reparent removed widgets to a temporary sink so a single deleteLater frees them all
+        sink = QWidget()
+        stack = [layout]
+        while stack:
+            current = stack.pop()
+            while current.count():
+                item = current.takeAt(0)
+                w = item.widget()
+                if w:
+                    w.setParent(sink)
+                elif item.layout():
+                    stack.append(item.layout())
+        sink.deleteLater()
 
     # ---------- setup ----------
     def _setup_ui(self, initial_channels=None, initial_colors=None):
@@ -118,24 +246,15 @@ class ChannelTab(QWidget):
         # Channel selection group
         channel_group = QGroupBox("表示チャンネル (Visible Channels)")
         channel_layout = QV(channel_group)
+        self._channel_group = channel_group
         self.checkboxes = []
         self.color_buttons = []
         self.channel_colors = []
 
-        if self.image_array is not None and getattr(self.image_array, "ndim", 0) >= 3:
-            n_channels = self.image_array.shape[2]
-            resolved_colors = self._default_colors(n_channels, initial_colors)
-
-            for i in range(n_channels):
-                checked = initial_channels[i] if initial_channels and i < len(initial_channels) else True
-                color = resolved_colors[i]
-                row = self._make_channel_row(i, checked, color)
-                channel_layout.addLayout(row)
-        else:
-            label = QLabel("チャンネル選択なし (グレースケール画像)")
-            label.setStyleSheet("color: #888;")
-            channel_layout.addWidget(label)
-
+        n_channels = self._channel_count(self.image_array)
+        checks, colors = self._resolve_channel_state(n_channels, initial_channels, initial_colors)
+        self._populate_channel_rows(channel_layout, checks, colors)
+        self._shape_sig = (getattr(self.image_array, "ndim", 0), n_channels)
         layout.addWidget(channel_group)
 
         # Select All / Deselect All
@@ -170,11 +289,17 @@ class ChannelTab(QWidget):
         layout.addStretch()
 
     # ---------- events ----------
-    def _on_channel_changed(self):
+    def _on_channel_changed(self, *_):
         self._emit_change()
 
+    def _on_color_button_clicked(self):
+        self._select_color(int(self.sender().property("channel_idx")))
+
     def _select_color(self, channel_idx):
         current_color = self.channel_colors[channel_idx]
+        # Imported on first use: most sessions never open the color picker
+        from PySide6.QtWidgets import QColorDialog
+
         color = QColorDialog.getColor(current_color, self, f"チャンネル {channel_idx} の色を選択")
         if color.isValid():
             self.channel_colors[channel_idx] = color
@@ -183,12 +308,21 @@ class ChannelTab(QWidget):
 
     # ---------- public API ----------
     def select_all(self):
-        for cb in self.checkboxes:
-            cb.setChecked(True)
+        self._set_all_checked(True)
 
     def deselect_all(self):
+        self._set_all_checked(False)
+
+    def _set_all_checked(self, checked):
+        """Set every channel checkbox and emit channels_changed once if anything changed."""
+        changed = False
         for cb in self.checkboxes:
-            cb.setChecked(False)
+            if cb.isChecked() != checked:
+                with QSignalBlocker(cb):
+                    cb.setChecked(checked)
+                changed = True
+        if changed:
+            self._emit_change()
 
     def reset_colors(self):
         """Reset channel colors to default (RGB for 3ch, white otherwise)."""
@@ -204,62 +338,73 @@ class ChannelTab(QWidget):
     def _build_mode_controls(self, controls_layout):
         """Rebuild only the radio button controls in the controls_layout.
         The colorbar label is handled separately and not removed here.
-        """
-        # Clear existing radio buttons
-        self._clear_layout(controls_layout)
 
+        Radios are recreated only when the channel category (1ch/2ch/hidden)
+        changes; otherwise the existing radios are just synced to the mode.
+        """
         # Determine channel configuration
         ndim = getattr(self.image_array, "ndim", 0) if self.image_array is not None else 0
         nchan = self.image_array.shape[2] if (ndim >= 3) else (1 if ndim == 2 else 0)
-
-        if nchan in (1, 2):
-            if nchan == 1:
+        category = "1ch" if nchan == 1 else ("2ch" if nchan == 2 else "hidden")
+
+        if category != self._mode_built_for:
+            # Clear existing radio buttons
+            for button in self._mode_button_group.buttons():
+                self._mode_button_group.removeButton(button)
+            self._clear_layout(controls_layout)
+            self._mode_radios = {}
+            self._mode_by_id = {}
+            if category == "1ch":
                 # 1ch: grayscale vs JET
-                group = QButtonGroup(self)
-                rb_gray = QRadioButton("グレースケール")
-                rb_jet = QRadioButton("擬似カラー (Jet)")
-                group.addButton(rb_gray)
-                group.addButton(rb_jet)
-                # Block signals during initialization to prevent spurious mode changes
-                rb_gray.blockSignals(True)
-                rb_jet.blockSignals(True)
-                rb_gray.setChecked(self._mode1 == "grayscale")
-                rb_jet.setChecked(self._mode1 == "jet")
-                rb_gray.blockSignals(False)
-                rb_jet.blockSignals(False)
-                # Now connect signals
-                rb_gray.toggled.connect(lambda checked: self._on_mode1_changed("grayscale" if checked else None))
-                rb_jet.toggled.connect(lambda checked: self._on_mode1_changed("jet" if checked else None))
-                controls_layout.addWidget(rb_gray)
-                controls_layout.addWidget(rb_jet)
-            else:
+                self._create_mode_radios(
+                    controls_layout,
+                    (("grayscale", "グレースケール"), ("jet", "擬似カラー (Jet)")),
+                )
+            elif category == "2ch":
                 # 2ch: composite vs flow-hsv
-                group = QButtonGroup(self)
-                rb_comp = QRadioButton("色合成 (Composite)")
-                rb_flow = QRadioButton("HSV (Flow)")
-                group.addButton(rb_comp)
-                group.addButton(rb_flow)
-                # Block signals during initialization to prevent spurious mode changes
-                rb_comp.blockSignals(True)
-                rb_flow.blockSignals(True)
-                rb_comp.setChecked(self._mode2 == "composite")
-                rb_flow.setChecked(self._mode2 == "flow-hsv")
-                rb_comp.blockSignals(False)
-                rb_flow.blockSignals(False)
-                # Now connect signals
-                rb_comp.toggled.connect(lambda checked: self._on_mode2_changed("composite" if checked else None))
-                rb_flow.toggled.connect(lambda checked: self._on_mode2_changed("flow-hsv" if checked else None))
-                controls_layout.addWidget(rb_comp)
-                controls_layout.addWidget(rb_flow)
+                self._create_mode_radios(
+                    controls_layout,
+                    (("composite", "色合成 (Composite)"), ("flow-hsv", "HSV (Flow)")),
+                )
+            self._mode_built_for = category
+
+        if category != "hidden":
+            current_mode = self._mode1 if category == "1ch" else self._mode2
+            # Block signals while syncing to prevent spurious mode changes
+            rb = self._mode_radios.get(current_mode)
+            if rb is not None:
+                with QSignalBlocker(self._mode_button_group):
+                    rb.setChecked(True)
 
             self._mode_group_box.setVisible(True)
             self._colorbar_label.setVisible(True)
-            self._update_colorbar()
         else:
             self._mode_group_box.setVisible(False)
             self._colorbar_label.setVisible(False)
+        self._update_colorbar()
+
+    def _create_mode_radios(self, controls_layout, options):
+        """Create one exclusive radio button per (mode, label) option."""
+        for button_id, (mode, label) in enumerate(options):
+            rb = QRadioButton(label)
+            self._mode_button_group.addButton(rb, button_id)
+            controls_layout.addWidget(rb)
+            self._mode_radios[mode] = rb
+            self._mode_by_id[button_id] = mode
+
+    def _on_mode_group_toggled(self, button_id, checked):
+        # Only the newly checked radio matters; ignore the matching uncheck
+        if not checked:
+            return
+        mode = self._mode_by_id.get(button_id)
+        if self._mode_built_for == "1ch":
+            self._on_mode1_changed(mode)
+        elif self._mode_built_for == "2ch":
+            self._on_mode2_changed(mode)
 
     def _update_colorbar(self):
+        # An immediate refresh supersedes any pending debounced one
+        self._colorbar_timer.stop()
         if self._colorbar_label is None:
             return
         # Determine channels again
@@ -275,45 +420,71 @@ class ChannelTab(QWidget):
                     # yout = gain*(yin - off)/sat*255 -> yin at 0 and 255
                     vmin = off
                     vmax = off + (sat / gain if gain not in (0, None) else 0)
-
-                    def fmt(v):
-                        if abs(v - round(v)) < 1e-6:
-                            return str(int(round(v)))
-                        return f"{v:.3f}"
-
-                    min_label = fmt(vmin)
-                    max_label = fmt(vmax)
+                    min_label = _format_colorbar_label(vmin)
+                    max_label = _format_colorbar_label(vmax)
                 except Exception:
                     pass
-            bar = colorbar_jet(256, 24, True, min_label=min_label, max_label=max_label)
+            key = ("jet", min_label, max_label)
         elif nchan == 2 and self._mode2 == "flow-hsv":
             # Circular HSV colorbar (no numeric labels)
-            bar = colorbar_flow_hsv(256, 256, False)
+            key = ("flow-hsv", None, None)
         else:
-            bar = None
-        if bar is None:
+            key = None
+        if key == self._colorbar_label_key:
+            # Already showing this colorbar; avoid a needless repaint
+            return
+        self._colorbar_label_key = key
+        if key is None:
             self._colorbar_label.clear()
             self._colorbar_label.setFixedSize(0, 0)
+            return
+
+        pixmap = self._colorbar_cache.get(key)
+        if pixmap is None:
+            pixmap = self._render_colorbar(*key)
+            self._colorbar_cache[key] = pixmap
+            if len(self._colorbar_cache) > self.COLORBAR_CACHE_SIZE:
+                self._colorbar_cache.popitem(last=False)
+        else:
+            self._colorbar_cache.move_to_end(key)
+
+        # Set appropriate size based on colorbar type
+        if key[0] == "flow-hsv":
+            # Circular colorbar: keep square aspect ratio, reasonable size
+            self._colorbar_label.setFixedSize(200, 200)
         else:
-            qimg = numpy_to_qimage(bar)
-            pixmap = QPixmap.fromImage(qimg)
+            # Linear colorbar (Jet): use original narrow height
+            self._colorbar_label.setFixedSize(256, 30)
+        self._colorbar_label.setPixmap(pixmap)
 
-            # Set appropriate size based on colorbar type
-            if nchan == 2 and self._mode2 == "flow-hsv":
-                # Circular colorbar: keep square aspect ratio, reasonable size
-                self._colorbar_label.setFixedSize(200, 200)
-                pixmap = pixmap.scaled(200, 200, Qt.KeepAspectRatio, Qt.SmoothTransformation)
-            else:
-                # Linear colorbar (Jet): use original narrow height
-                self._colorbar_label.setFixedSize(256, 30)
-                pixmap = pixmap.scaled(256, 30, Qt.KeepAspectRatio, Qt.SmoothTransformation)
+    def _render_colorbar(self, kind, min_label=None, max_label=None):
+        """Render a colorbar pixmap at its display size (no rescaling pass).
 
-            self._colorbar_label.setPixmap(pixmap)
+        Args:
+            kind: "jet" or "flow-hsv"
+            min_label: Caption for the low end of the Jet colorbar
+            max_label: Caption for the high end of the Jet colorbar
+
+        Returns:
+            QPixmap ready to be shown in the colorbar label
+        """
+        # Imported on first render; only 1ch Jet / 2ch flow-HSV modes show a colorbar
+        from ....utils import colorbar_jet, colorbar_flow_hsv
+        from PixelScopeViewer.core.image_io import numpy_to_qimage
+
+        if kind == "flow-hsv":
+            # Drawn directly at the 200x200 label size
+            bar = colorbar_flow_hsv(200, 200, False)
+        else:
+            # 256x24 already fits the 256x30 label at its natural size
+            bar = colorbar_jet(256, 24, True, min_label=min_label, max_label=max_label)
+        return QPixmap.fromImage(numpy_to_qimage(bar))
 
     # Receive brightness updates for colorbar captions
     def on_brightness_for_colorbar(self, offset, gain, saturation):
         self._last_brightness = (offset, gain, saturation)
-        self._update_colorbar()
+        # (Re)start the timer so only the last update of a burst refreshes the colorbar
+        self._colorbar_timer.start()
 
     def _on_mode1_changed(self, mode: str | None):
         if mode is None:
@@ -337,54 +508,56 @@ class ChannelTab(QWidget):
         return [cb.isChecked() for cb in self.checkboxes]
 
     def set_channel_states(self, states):
-        for i, state in enumerate(states or []):
-            if i < len(self.checkboxes):
-                self.checkboxes[i].setChecked(state)
+        changed = False
+        self._suspend_emit = True
+        try:
+            for i, state in enumerate(states or []):
+                if i >= len(self.checkboxes):
+                    break
+                if self.checkboxes[i].isChecked() != bool(state):
+                    self.checkboxes[i].setChecked(state)
+                    changed = True
+        finally:
+            self._suspend_emit = False
+        if changed:
+            self._emit_change()
 
     def get_channel_colors(self):
         return self.channel_colors.copy()
 
     def set_channel_colors(self, colors):
-        for i, color in enumerate(colors or []):
-            if i < len(self.channel_colors):
+        changed = False
+        self._suspend_emit = True
+        try:
+            for i, color in enumerate(colors or []):
+                if i >= len(self.channel_colors):
+                    break
+                if self.channel_colors[i].rgba() == color.rgba():
+                    continue
                 self.channel_colors[i] = color
+                changed = True
                 if i < len(self.color_buttons):
                     self._update_color_button(self.color_buttons[i], color)
+        finally:
+            self._suspend_emit = False
+        if changed:
+            self._emit_color_change()
 
     def update_for_new_image(self, image_array=None, channel_checks=None, channel_colors=None):
         self.image_array = image_array
-        # Find or create group
-        group = None
-        for child in self.children():
-            if isinstance(child, QGroupBox) and "チャンネル" in child.title():
-                group = child
-                break
+        group = self._channel_group
         if group is None:
             return
         layout = group.layout()
 
-        # Clear current UI
-        self._clear_layout(layout)
-        self.checkboxes.clear()
-        self.color_buttons.clear()
-        self.channel_colors.clear()
-
-        # Rebuild
-        if self.image_array is not None and getattr(self.image_array, "ndim", 0) >= 3:
-            n_channels = self.image_array.shape[2]
-            resolved_colors = self._default_colors(n_channels, channel_colors)
+        # Reuse pooled channel rows; skip entirely if layout and state are unchanged
+        n_channels = self._channel_count(self.image_array)
+        shape_sig = (getattr(self.image_array, "ndim", 0), n_channels)
+        checks, colors = self._resolve_channel_state(n_channels, channel_checks, channel_colors)
+        if shape_sig != self._shape_sig or not self._channel_state_matches(checks, colors):
+            self._populate_channel_rows(layout, checks, colors)
+        self._shape_sig = shape_sig
 
-            for i in range(n_channels):
-                checked = channel_checks[i] if channel_checks and i < len(channel_checks) else True
-                color = resolved_colors[i]
-                row = self._make_channel_row(i, checked, color)
-                layout.addLayout(row)
-        else:
-            label = QLabel("チャンネル選択なし (グレースケール画像)")
-            label.setStyleSheet("color: #888;")
-            layout.addWidget(label)
-
-        # Rebuild mode controls (reuse existing layouts/label)
+        # Rebuild mode controls (reuse existing layouts/label); this also refreshes the colorbar
         if self._mode_group_box is not None and self._mode_controls_layout is not None:
             self._build_mode_controls(self._mode_controls_layout)
-            self._update_colorbar()
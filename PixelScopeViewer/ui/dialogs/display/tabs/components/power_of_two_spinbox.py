@@ -4,6 +4,17 @@ import math
 from PySide6.QtWidgets import QDoubleSpinBox
 
 
+def _format_power_of_2(value):
+    """Format a positive value with the minimal decimal places for powers of 2."""
+    if value >= 1.0:
+        # For values >= 1, display as integer
+        return f"{int(value)}"
+    # For fractional values (< 1), calculate minimal decimal places needed
+    # Powers of 2 less than 1: 0.5, 0.25, 0.125, 0.0625, etc.
+    decimals = max(1, abs(int(math.log2(value))))
+    return f"{value:.{decimals}f}".rstrip("0").rstrip(".")
+
+
 class PowerOfTwoSpinBox(QDoubleSpinBox):
     """Custom spin box that steps by powers of 2."""
 
@@ -11,6 +22,9 @@ class PowerOfTwoSpinBox(QDoubleSpinBox):
         super().__init__(parent)
         self._log2_min = log2_min
         self._log2_max = log2_max
+        # Precomputed values and display text for every exponent in range
+        self._values = tuple(math.ldexp(1.0, k) for k in range(log2_min, log2_max + 1))
+        self._text_by_value = {value: _format_power_of_2(value) for value in self._values}
 
     def stepBy(self, steps):
         """Override to step by powers of 2."""
@@ -18,34 +32,23 @@ class PowerOfTwoSpinBox(QDoubleSpinBox):
         if current_value <= 0:
             current_value = 1.0
 
-        # Get current log2 value
-        current_log2 = math.log2(current_value)
-
-        # Round to nearest integer and apply steps
-        current_log2_int = round(current_log2)
-        new_log2 = current_log2_int + steps
+        # Round current value to the nearest exponent and apply steps
+        new_log2 = round(math.log2(current_value)) + steps
 
-        # Clamp to valid range
+        # Clamp to valid range and look up the value
         new_log2 = max(self._log2_min, min(self._log2_max, new_log2))
-
-        # Convert back to actual value
-        new_value = 2**new_log2
+        new_value = self._values[new_log2 - self._log2_min]
 
         # Set the new value (this will trigger valueChanged signal)
         self.setValue(new_value)
 
     def textFromValue(self, value):
         """Override to display optimal decimal places for powers of 2."""
+        text = self._text_by_value.get(value)
+        if text is not None:
+            return text
+
         if value <= 0:
             # Handle invalid values
             return "0"
-
-        if value >= 1.0:
-            # For values >= 1, display as integer
-            return f"{int(value)}"
-        else:
-            # For fractional values (< 1), calculate minimal decimal places needed
-            # Powers of 2 less than 1: 0.5, 0.25, 0.125, 0.0625, etc.
-            log2_val = math.log2(value)
-            decimals = max(1, abs(int(log2_val)))
-            return f"{value:.{decimals}f}".rstrip("0").rstrip(".")
+        return _format_power_of_2(value)
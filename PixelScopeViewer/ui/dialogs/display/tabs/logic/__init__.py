@@ -6,6 +6,7 @@ from .brightness_utils import (
     clamp_value,
     slider_to_value,
     value_to_slider,
+    nearest_power_of_2_log2,
     round_to_power_of_2,
     format_value_label,
     format_gain_label,
@@ -18,6 +19,7 @@ __all__ = [
     "clamp_value",
     "slider_to_value",
     "value_to_slider",
+    "nearest_power_of_2_log2",
     "round_to_power_of_2",
     "format_value_label",
     "format_gain_label",
@@ -1,6 +1,9 @@
 """UI builder for BrightnessTab - handles all widget creation and layout."""
 
-from PySide6.QtCore import Qt
+import math
+from dataclasses import dataclass
+
+from PySide6.QtCore import Qt, QSignalBlocker, QTimer
 from PySide6.QtWidgets import (
     QVBoxLayout,
     QHBoxLayout,
@@ -13,17 +16,53 @@ from PySide6.QtWidgets import (
 
 from ..components import PowerOfTwoSpinBox
 
+# Style rules per widget role, shared by every BrightnessTab instance
+_TITLE_LABEL_QSS = 'QLabel[role="title"] { font-weight: bold; font-size: 10pt; }'
+_VALUE_LABEL_QSS = 'QLabel[role="value"] { color: #555; font-size: 10pt; }'
+_CAPTION_QSS = 'QLabel[role="caption"] { font-size: 9pt; color: #888; min-width: 50px; }'
+_FORMULA_QSS = 'QLabel[role="formula"] { font-style: italic; font-size: 10pt; }'
+_SLIDER_QSS = """
+QSlider[role="brightness"]::groove:horizontal { background: #ddd; height: 6px; border-radius: 3px; }
+QSlider[role="brightness"]::handle:horizontal { background: #666; width: 16px; margin: -5px 0; border-radius: 8px; }
+QSlider[role="brightness"]::handle:horizontal:hover { background: #444; }
+"""
+_SPINBOX_QSS = 'QDoubleSpinBox[role="brightness"] { padding: 10px; font-size: 10pt; }'
+
+_BRIGHTNESS_QSS = "\n".join(
+    (_TITLE_LABEL_QSS, _VALUE_LABEL_QSS, _CAPTION_QSS, _FORMULA_QSS, _SLIDER_QSS.strip(), _SPINBOX_QSS)
+)
+
+
+@dataclass(frozen=True, slots=True)
+class _ControlSpec:
+    """Static description of one label + slider + spinbox control group."""
+
+    key: str  # widget key prefix, e.g. "offset" -> "offset_slider"
+    title: str
+    caption: str
+    value_text: str
+    slider_range: tuple
+    slider_value: int
+    tick_interval: int
+    spinbox_range: tuple
+    spinbox_value: float
+    decimals: int
+    single_step: float
+    keyboard_tracking: bool = True
+    spinbox_width: int | None = None
+    spacing: int | None = None
+    tooltip: str | None = None
+
 
 class BrightnessUIBuilder:
     """Responsible for building all UI components for BrightnessTab."""
 
-    SLIDER_STYLESHEET = """
-        QSlider::groove:horizontal { background: #ddd; height: 6px; border-radius: 3px; }
-        QSlider::handle:horizontal { background: #666; width: 16px; margin: -5px 0; border-radius: 8px; }
-        QSlider::handle:horizontal:hover { background: #444; }
-    """
+    # Applied once to the parent widget; child widgets are matched by their "role" property
+    # so Qt parses a single stylesheet instead of one per widget.
+    STYLESHEET = _BRIGHTNESS_QSS
 
-    SPINBOX_STYLESHEET = "QSpinBox, QDoubleSpinBox { padding: 10px; font-size: 10pt; }"
+    # Slider drags deliver at most one value per control per interval (~60 Hz)
+    SLIDER_THROTTLE_MS = 16
 
     def __init__(self, parent_widget):
         """Initialize the UI builder.
@@ -33,6 +72,42 @@ class BrightnessUIBuilder:
         """
         self.parent = parent_widget
         self.widgets = {}
+        self.parent.setStyleSheet(self.STYLESHEET)
+
+        # Latest dragged slider value per control: {key: (callback, value)}
+        self._pending = {}
+        self._throttle_timer = QTimer(parent_widget)
+        self._throttle_timer.setSingleShot(True)
+        self._throttle_timer.setInterval(self.SLIDER_THROTTLE_MS)
+        self._throttle_timer.timeout.connect(self._flush_pending)
+
+    def _connect_slider(self, key, slider, callback):
+        """Connect slider.valueChanged to callback, coalescing values while the handle is dragged.
+
+        Programmatic, keyboard and page-step changes are delivered immediately.
+        """
+
+        def on_value_changed(value):
+            if slider.isSliderDown():
+                self._pending[key] = (callback, value)
+                if not self._throttle_timer.isActive():
+                    self._throttle_timer.start()
+            else:
+                # A direct change supersedes any value still waiting from a drag
+                self._pending.pop(key, None)
+                callback(value)
+
+        slider.valueChanged.connect(on_value_changed)
+
+    def discard_pending(self):
+        """Drop slider drag values not yet delivered, e.g. before the widgets are written programmatically."""
+        self._throttle_timer.stop()
+        self._pending.clear()
+
+    def _flush_pending(self):
+        pending, self._pending = self._pending, {}
+        for callback, value in pending.values():
+            callback(value)
 
     def build_dtype_selector(self, layout, current_dtype, on_dtype_changed_callback):
         """Build the dtype selector combo box.
@@ -44,7 +119,7 @@ class BrightnessUIBuilder:
         """
         dtype_layout = QHBoxLayout()
         dtype_label = QLabel("データ型 (Data Type):")
-        dtype_label.setStyleSheet("font-weight: bold; font-size: 10pt;")
+        dtype_label.setProperty("role", "title")
 
         dtype_combo = QComboBox()
         dtype_combo.addItems(["float", "uint8", "uint16"])
@@ -61,22 +136,13 @@ class BrightnessUIBuilder:
         self.widgets["dtype_combo"] = dtype_combo
         return dtype_combo
 
-    def build_offset_controls(
-        self,
-        layout,
-        initial_value,
-        offset_range,
-        is_float,
-        slider_callback,
-        spinbox_callback,
-    ):
-        """Build offset label, slider and spinbox controls.
+    def _build_numeric_control(self, layout, spec, spinbox, slider_callback, spinbox_callback):
+        """Build one title/value label row plus a slider + spinbox row from a spec.
 
         Args:
             layout: QVBoxLayout to add to
-            initial_value: Initial offset value
-            offset_range: Tuple (min, max)
-            is_float: Whether values are float type
+            spec: _ControlSpec describing labels, ranges and initial values
+            spinbox: Spinbox instance to configure (QDoubleSpinBox or subclass)
             slider_callback: Callback for slider changes
             spinbox_callback: Callback for spinbox changes
 
@@ -85,11 +151,13 @@ class BrightnessUIBuilder:
         """
         # Label with value
         label_layout = QHBoxLayout()
-        title_label = QLabel("オフセット (Offset)")
-        title_label.setStyleSheet("font-weight: bold; font-size: 10pt;")
+        title_label = QLabel(spec.title)
+        title_label.setProperty("role", "title")
+        if spec.tooltip:
+            title_label.setToolTip(spec.tooltip)
 
-        value_label = QLabel(f"{initial_value:.0f}" if not is_float else f"{initial_value:.5f}")
-        value_label.setStyleSheet("color: #555; font-size: 10pt;")
+        value_label = QLabel(spec.value_text)
+        value_label.setProperty("role", "value")
 
         label_layout.addWidget(title_label)
         label_layout.addWidget(value_label)
@@ -98,49 +166,90 @@ class BrightnessUIBuilder:
 
         # Controls
         control_layout = QHBoxLayout()
-        control_layout.setSpacing(10)
+        if spec.spacing is not None:
+            control_layout.setSpacing(spec.spacing)
 
-        caption = QLabel("Offset")
-        caption.setStyleSheet("font-size: 9pt; color: #888; min-width: 50px;")
+        caption = QLabel(spec.caption)
+        caption.setProperty("role", "caption")
         caption.setAlignment(Qt.AlignRight | Qt.AlignVCenter)
         control_layout.addWidget(caption)
 
         slider = QSlider(Qt.Horizontal)
-        slider.setRange(int(offset_range[0] * 10), int(offset_range[1] * 10))
+        slider.setRange(*spec.slider_range)
         slider.setTickPosition(QSlider.TicksBelow)
-        slider.setTickInterval((offset_range[1] - offset_range[0]) // 4)
-        slider.setStyleSheet(self.SLIDER_STYLESHEET)
-        slider.blockSignals(True)
-        slider.setValue(int(initial_value * 10))
-        slider.blockSignals(False)
-        slider.valueChanged.connect(slider_callback)
-
-        spinbox = QDoubleSpinBox()
-        if is_float:
-            spinbox.setDecimals(5)
-            spinbox.setSingleStep(0.01)
-        else:
-            spinbox.setDecimals(0)
-            spinbox.setSingleStep(1)
-        spinbox.setReadOnly(False)
-        spinbox.setKeyboardTracking(True)
-        spinbox.setRange(offset_range[0], offset_range[1])
-        spinbox.setStyleSheet(self.SPINBOX_STYLESHEET)
-        spinbox.blockSignals(True)
-        spinbox.setValue(initial_value)
-        spinbox.blockSignals(False)
+        slider.setTickInterval(spec.tick_interval)
+        slider.setProperty("role", "brightness")
+        with QSignalBlocker(slider):
+            slider.setValue(spec.slider_value)
+        self._connect_slider(spec.key, slider, slider_callback)
+
+        spinbox.setDecimals(spec.decimals)
+        spinbox.setSingleStep(spec.single_step)
+        spinbox.setKeyboardTracking(spec.keyboard_tracking)
+        spinbox.setRange(*spec.spinbox_range)
+        if spec.spinbox_width is not None:
+            spinbox.setFixedWidth(spec.spinbox_width)
+        spinbox.setProperty("role", "brightness")
+        with QSignalBlocker(spinbox):
+            spinbox.setValue(spec.spinbox_value)
         spinbox.valueChanged.connect(spinbox_callback)
 
         control_layout.addWidget(slider, 4)
         control_layout.addWidget(spinbox, 1)
         layout.addLayout(control_layout)
 
-        self.widgets["offset_value_label"] = value_label
-        self.widgets["offset_slider"] = slider
-        self.widgets["offset_spinbox"] = spinbox
+        self.widgets[f"{spec.key}_value_label"] = value_label
+        self.widgets[f"{spec.key}_slider"] = slider
+        self.widgets[f"{spec.key}_spinbox"] = spinbox
 
         return value_label, slider, spinbox
 
+    def build_offset_controls(
+        self,
+        layout,
+        initial_value,
+        offset_range,
+        is_float,
+        slider_callback,
+        spinbox_callback,
+        slider_range=None,
+        tick_interval=None,
+    ):
+        """Build offset label, slider and spinbox controls.
+
+        Args:
+            layout: QVBoxLayout to add to
+            initial_value: Initial offset value
+            offset_range: Tuple (min, max)
+            is_float: Whether values are float type
+            slider_callback: Callback for slider changes
+            spinbox_callback: Callback for spinbox changes
+            slider_range: Precomputed slider (min, max); derived from offset_range if None
+            tick_interval: Precomputed slider tick interval; derived from offset_range if None
+
+        Returns:
+            tuple: (value_label, slider, spinbox)
+        """
+        if slider_range is None:
+            slider_range = (int(offset_range[0] * 10), int(offset_range[1] * 10))
+        if tick_interval is None:
+            tick_interval = (offset_range[1] - offset_range[0]) // 4
+        spec = _ControlSpec(
+            key="offset",
+            title="オフセット (Offset)",
+            caption="Offset",
+            value_text=f"{initial_value:.5f}" if is_float else f"{initial_value:.0f}",
+            slider_range=slider_range,
+            slider_value=int(initial_value * 10),
+            tick_interval=tick_interval,
+            spinbox_range=offset_range,
+            spinbox_value=initial_value,
+            decimals=5 if is_float else 0,
+            single_step=0.01 if is_float else 1,
+            spacing=10,
+        )
+        return self._build_numeric_control(layout, spec, QDoubleSpinBox(), slider_callback, spinbox_callback)
+
     def build_gain_controls(
         self,
         layout,
@@ -167,65 +276,28 @@ class BrightnessUIBuilder:
         Returns:
             tuple: (value_label, slider, spinbox)
         """
-        import math
-
-        # Label with value
-        label_layout = QHBoxLayout()
-        title_label = QLabel("ゲイン (Gain)")
-        title_label.setStyleSheet("font-weight: bold; font-size: 10pt;")
-        title_label.setToolTip("ゲイン×0.5 : <,  ゲイン×2 : >")
-
-        value_label = QLabel(f"{initial_value:.2f}")
-        value_label.setStyleSheet("color: #555; font-size: 10pt;")
-
-        label_layout.addWidget(title_label)
-        label_layout.addWidget(value_label)
-        label_layout.addStretch()
-        layout.addLayout(label_layout)
-
-        # Controls
-        control_layout = QHBoxLayout()
-        caption = QLabel("Gain")
-        caption.setStyleSheet("font-size: 9pt; color: #888; min-width: 50px;")
-        caption.setAlignment(Qt.AlignRight | Qt.AlignVCenter)
-        control_layout.addWidget(caption)
-
         # Slider uses log2 scale
-        slider = QSlider(Qt.Horizontal)
-        slider.setRange(log2_min, log2_max)
-        slider.setTickPosition(QSlider.TicksBelow)
-        slider.setTickInterval(1)
-        slider.setStyleSheet(self.SLIDER_STYLESHEET)
-        slider.blockSignals(True)
         initial_log2 = int(round(math.log2(initial_value)))
-        initial_log2 = max(log2_min, min(log2_max, initial_log2))
-        slider.setValue(initial_log2)
-        slider.blockSignals(False)
-        slider.valueChanged.connect(slider_callback)
-
+        spec = _ControlSpec(
+            key="gain",
+            title="ゲイン (Gain)",
+            caption="Gain",
+            value_text=f"{initial_value:.2f}",
+            slider_range=(log2_min, log2_max),
+            slider_value=max(log2_min, min(log2_max, initial_log2)),
+            tick_interval=1,
+            spinbox_range=(spinbox_min, spinbox_max),
+            spinbox_value=initial_value,
+            decimals=7,
+            single_step=1,
+            # Snap typed gain only on Enter/focus-out, not on every keystroke
+            keyboard_tracking=False,
+            spinbox_width=100,
+            tooltip="ゲイン×0.5 : <,  ゲイン×2 : >",
+        )
         # Spinbox with power-of-2 stepping
         spinbox = PowerOfTwoSpinBox(log2_min=log2_min, log2_max=log2_max)
-        spinbox.setDecimals(7)
-        spinbox.setSingleStep(1)
-        spinbox.setReadOnly(False)
-        spinbox.setKeyboardTracking(True)
-        spinbox.setRange(spinbox_min, spinbox_max)
-        spinbox.setFixedWidth(100)
-        spinbox.setStyleSheet(self.SPINBOX_STYLESHEET)
-        spinbox.blockSignals(True)
-        spinbox.setValue(initial_value)
-        spinbox.blockSignals(False)
-        spinbox.valueChanged.connect(spinbox_callback)
-
-        control_layout.addWidget(slider, 4)
-        control_layout.addWidget(spinbox, 1)
-        layout.addLayout(control_layout)
-
-        self.widgets["gain_value_label"] = value_label
-        self.widgets["gain_slider"] = slider
-        self.widgets["gain_spinbox"] = spinbox
-
-        return value_label, slider, spinbox
+        return self._build_numeric_control(layout, spec, spinbox, slider_callback, spinbox_callback)
 
     def build_saturation_controls(
         self,
@@ -235,6 +307,8 @@ class BrightnessUIBuilder:
         is_float,
         slider_callback,
         spinbox_callback,
+        slider_range=None,
+        tick_interval=None,
     ):
         """Build saturation label, slider and spinbox controls.
 
@@ -245,74 +319,31 @@ class BrightnessUIBuilder:
             is_float: Whether values are float type
             slider_callback: Callback for slider changes
             spinbox_callback: Callback for spinbox changes
+            slider_range: Precomputed slider (min, max); derived from saturation_range if None
+            tick_interval: Precomputed slider tick interval; derived from saturation_range if None
 
         Returns:
             tuple: (value_label, slider, spinbox)
         """
-        # Label with value
-        label_layout = QHBoxLayout()
-        title_label = QLabel("飽和レベル (Saturation)")
-        title_label.setStyleSheet("font-weight: bold; font-size: 10pt;")
-
-        value_label = QLabel(f"{initial_value:.0f}" if not is_float else f"{initial_value:.5f}")
-        value_label.setStyleSheet("color: #555; font-size: 10pt;")
-
-        label_layout.addWidget(title_label)
-        label_layout.addWidget(value_label)
-        label_layout.addStretch()
-        layout.addLayout(label_layout)
-
-        # Controls
-        control_layout = QHBoxLayout()
-        caption = QLabel("Saturation")
-        caption.setStyleSheet("font-size: 9pt; color: #888; min-width: 50px;")
-        caption.setAlignment(Qt.AlignRight | Qt.AlignVCenter)
-        control_layout.addWidget(caption)
-
-        slider = QSlider(Qt.Horizontal)
-        slider.setTickPosition(QSlider.TicksBelow)
-        slider.setStyleSheet(self.SLIDER_STYLESHEET)
-
-        if is_float:
-            slider.setRange(int(saturation_range[0] * 1000), int(saturation_range[1] * 1000))
-            slider.setTickInterval(int((saturation_range[1] - saturation_range[0]) * 1000 / 4))
-            slider.blockSignals(True)
-            slider.setValue(int(initial_value * 1000))
-            slider.blockSignals(False)
-        else:
-            slider.setRange(saturation_range[0], saturation_range[1])
-            slider.setTickInterval((saturation_range[1] - saturation_range[0]) // 4)
-            slider.blockSignals(True)
-            slider.setValue(int(initial_value))
-            slider.blockSignals(False)
-
-        slider.valueChanged.connect(slider_callback)
-
-        spinbox = QDoubleSpinBox()
-        if is_float:
-            spinbox.setDecimals(5)
-            spinbox.setSingleStep(0.01)
-        else:
-            spinbox.setDecimals(0)
-            spinbox.setSingleStep(1)
-        spinbox.setReadOnly(False)
-        spinbox.setKeyboardTracking(True)
-        spinbox.setRange(saturation_range[0], saturation_range[1])
-        spinbox.setStyleSheet(self.SPINBOX_STYLESHEET)
-        spinbox.blockSignals(True)
-        spinbox.setValue(initial_value)
-        spinbox.blockSignals(False)
-        spinbox.valueChanged.connect(spinbox_callback)
-
-        control_layout.addWidget(slider, 4)
-        control_layout.addWidget(spinbox, 1)
-        layout.addLayout(control_layout)
-
-        self.widgets["saturation_value_label"] = value_label
-        self.widgets["saturation_slider"] = slider
-        self.widgets["saturation_spinbox"] = spinbox
-
-        return value_label, slider, spinbox
+        scale = 1000 if is_float else 1
+        if slider_range is None:
+            slider_range = (int(saturation_range[0] * scale), int(saturation_range[1] * scale))
+        if tick_interval is None:
+            tick_interval = int((saturation_range[1] - saturation_range[0]) * scale / 4)
+        spec = _ControlSpec(
+            key="saturation",
+            title="飽和レベル (Saturation)",
+            caption="Saturation",
+            value_text=f"{initial_value:.5f}" if is_float else f"{initial_value:.0f}",
+            slider_range=slider_range,
+            slider_value=int(initial_value * scale),
+            tick_interval=tick_interval,
+            spinbox_range=saturation_range,
+            spinbox_value=initial_value,
+            decimals=5 if is_float else 0,
+            single_step=0.01 if is_float else 1,
+        )
+        return self._build_numeric_control(layout, spec, QDoubleSpinBox(), slider_callback, spinbox_callback)
 
     def build_formula_and_reset(self, layout, reset_callback):
         """Build formula label and reset button.
@@ -325,7 +356,7 @@ class BrightnessUIBuilder:
             QPushButton: The reset button
         """
         formula_label = QLabel("-> yout = gain × (yin - offset) / saturation × 255")
-        formula_label.setStyleSheet("font-style: italic; font-size: 10pt")
+        formula_label.setProperty("role", "formula")
         layout.addWidget(formula_label)
 
         reset_button = QPushButton("Reset (Ctrl+R)")
@@ -1,18 +1,107 @@
 """Utility functions for brightness calculations and conversions."""
 
 import math
-import numpy as np
+from functools import lru_cache
+from types import MappingProxyType
+
+
+def _slider_ranges(offset_range, saturation_range, is_float):
+    """Compute integer slider ranges and tick intervals for offset and saturation controls.
+
+    Offset sliders use a fixed x10 scale; saturation sliders use x1000 for
+    float images and the raw value for integer images. Tick intervals split
+    each range into quarters (the offset tick is in offset units).
+
+    Returns:
+        tuple: (offset_slider_range, offset_slider_tick, saturation_slider_range, saturation_slider_tick)
+    """
+    offset_slider_range = (int(offset_range[0] * 10), int(offset_range[1] * 10))
+    offset_slider_tick = int((offset_range[1] - offset_range[0]) // 4)
+    if is_float:
+        saturation_slider_range = (int(saturation_range[0] * 1000), int(saturation_range[1] * 1000))
+        saturation_slider_tick = int((saturation_range[1] - saturation_range[0]) * 1000 / 4)
+    else:
+        saturation_slider_range = (int(saturation_range[0]), int(saturation_range[1]))
+        saturation_slider_tick = (saturation_range[1] - saturation_range[0]) // 4
+    return offset_slider_range, offset_slider_tick, saturation_slider_range, saturation_slider_tick
+
+
+def _build_dtype_defaults(dtype_key, is_float_type, initial_offset, initial_saturation, offset_range, saturation_range):
+    """Build a read-only defaults payload including precomputed slider ranges."""
+    offset_slider_range, offset_slider_tick, saturation_slider_range, saturation_slider_tick = _slider_ranges(
+        offset_range, saturation_range, is_float_type
+    )
+    return MappingProxyType(
+        {
+            "dtype_key": dtype_key,
+            "is_float_type": is_float_type,
+            "initial_offset": initial_offset,
+            "initial_gain": 1.0,
+            "initial_saturation": initial_saturation,
+            "offset_range": offset_range,
+            "gain_range": (0.1, 10.0),
+            "saturation_range": saturation_range,
+            "offset_slider_range": offset_slider_range,
+            "offset_slider_tick": offset_slider_tick,
+            "saturation_slider_range": saturation_slider_range,
+            "saturation_slider_tick": saturation_slider_tick,
+            "saturation_slider_scale": 1000 if is_float_type else 1,
+        }
+    )
+
+
+# Defaults per dtype key, built once at import time
+_DTYPE_DEFAULTS = {
+    "float": _build_dtype_defaults("float", True, 0.0, 1.0, (-1.0, 1.0), (0.001, 10.0)),
+    "uint8": _build_dtype_defaults("uint8", False, 0, 255, (-255, 255), (1, 255)),
+    "uint16": _build_dtype_defaults("uint16", False, 0, 1023, (-1023, 1023), (1, 4095)),
+}
+
+# Defaults for dtypes detected from image data (wider uint16 ranges than the presets)
+_DETECTED_DTYPE_DEFAULTS = {
+    "float": _build_dtype_defaults("float", True, 0, 1.0, (-1.0, 1.0), (0.001, 10.0)),
+    "uint8": _DTYPE_DEFAULTS["uint8"],
+    "uint16": _build_dtype_defaults("uint16", False, 0, 1023, (-32767, 32767), (1, 65535)),
+}
+
+
+# Resolved dtype key per numpy dtype; images use only a handful of dtypes
+_DTYPE_KEY_CACHE = {}
+
+
+def _array_dtype_key(dtype):
+    """Map a numpy dtype to a dtype key using only its kind and item size.
+
+    Returns:
+        "float" for floating types, "uint16" for integer types wider than
+        8 bits, or None when the dtype does not override the default.
+    """
+    try:
+        return _DTYPE_KEY_CACHE[dtype]
+    except KeyError:
+        pass
+    kind = dtype.kind
+    if kind == "f":
+        key = "float"
+    elif kind in "iu" and dtype.itemsize > 1:
+        key = "uint16"
+    else:
+        key = None
+    _DTYPE_KEY_CACHE[dtype] = key
+    return key
 
 
 def determine_dtype_defaults(image_array=None, image_path=None):
     """Determine default brightness parameters based on image type.
 
+    Only ``image_array.dtype`` is inspected; pixel data is never scanned.
+
     Args:
         image_array: numpy array of the image (optional)
         image_path: path to the image file (optional)
 
     Returns:
-        dict: Dictionary containing:
+        Mapping: Read-only mapping containing:
             - dtype_key: "uint8", "uint16", or "float"
             - is_float_type: bool
             - initial_offset: float
@@ -21,44 +110,24 @@ def determine_dtype_defaults(image_array=None, image_path=None):
             - offset_range: tuple (min, max)
             - gain_range: tuple (min, max)
             - saturation_range: tuple (min, max)
+            - offset_slider_range: tuple (min, max) in slider units
+            - offset_slider_tick: int slider tick interval
+            - saturation_slider_range: tuple (min, max) in slider units
+            - saturation_slider_tick: int slider tick interval
+            - saturation_slider_scale: slider units per saturation unit
+            The mapping is shared between calls; copy it with dict() to modify.
     """
-    result = {
-        "dtype_key": "uint8",
-        "is_float_type": False,
-        "initial_offset": 0,
-        "initial_gain": 1.0,
-        "initial_saturation": 255,
-        "offset_range": (-255, 255),
-        "gain_range": (0.1, 10.0),
-        "saturation_range": (1, 255),
-    }
+    dtype_key = "uint8"
 
     # Check for .bin file special case
     if image_path and image_path.lower().endswith(".bin"):
-        result["dtype_key"] = "uint16"
-        result["initial_saturation"] = 1023
-        result["saturation_range"] = (1, 65535)
-        result["offset_range"] = (-32767, 32767)
+        dtype_key = "uint16"
 
     # Override with actual image dtype if available
     if image_array is not None:
-        dtype = image_array.dtype
-        if np.issubdtype(dtype, np.floating):
-            result["dtype_key"] = "float"
-            result["is_float_type"] = True
-            result["initial_saturation"] = 1.0
-            result["saturation_range"] = (0.001, 10.0)
-            result["offset_range"] = (-1.0, 1.0)
-        elif np.issubdtype(dtype, np.integer):
-            info = np.iinfo(dtype)
-            max_val = info.max
-            if max_val > 255:
-                result["dtype_key"] = "uint16"
-                result["initial_saturation"] = 1023
-                result["saturation_range"] = (1, 65535)
-                result["offset_range"] = (-32767, 32767)
-
-    return result
+        dtype_key = _array_dtype_key(image_array.dtype) or dtype_key
+
+    return _DETECTED_DTYPE_DEFAULTS[dtype_key]
 
 
 def get_dtype_defaults(dtype_key):
@@ -68,46 +137,16 @@ def get_dtype_defaults(dtype_key):
         dtype_key: "uint8", "uint16", or "float"
 
     Returns:
-        dict: Dictionary with same structure as determine_dtype_defaults
+        Mapping: Read-only mapping with same structure as determine_dtype_defaults.
     """
-    defaults = {
-        "float": {
-            "dtype_key": "float",
-            "is_float_type": True,
-            "initial_offset": 0.0,
-            "initial_gain": 1.0,
-            "initial_saturation": 1.0,
-            "offset_range": (-1.0, 1.0),
-            "gain_range": (0.1, 10.0),
-            "saturation_range": (0.001, 10.0),
-        },
-        "uint8": {
-            "dtype_key": "uint8",
-            "is_float_type": False,
-            "initial_offset": 0,
-            "initial_gain": 1.0,
-            "initial_saturation": 255,
-            "offset_range": (-255, 255),
-            "gain_range": (0.1, 10.0),
-            "saturation_range": (1, 255),
-        },
-        "uint16": {
-            "dtype_key": "uint16",
-            "is_float_type": False,
-            "initial_offset": 0,
-            "initial_gain": 1.0,
-            "initial_saturation": 1023,
-            "offset_range": (-1023, 1023),
-            "gain_range": (0.1, 10.0),
-            "saturation_range": (1, 4095),
-        },
-    }
-    return defaults.get(dtype_key, defaults["uint8"])
+    return _DTYPE_DEFAULTS.get(dtype_key, _DTYPE_DEFAULTS["uint8"])
 
 
 def clamp_value(value, min_val, max_val):
     """Clamp a value to a range."""
-    return max(min_val, min(max_val, value))
+    # Same result as max(min_val, min(max_val, value)) without two builtin calls
+    value = value if value < max_val else max_val
+    return value if value > min_val else min_val
 
 
 def slider_to_value(slider_value, is_float, multiplier=10):
@@ -142,6 +181,19 @@ def value_to_slider(value, is_float, multiplier=10):
     return int(value)
 
 
+_SQRT_HALF = math.sqrt(0.5)
+
+
+def _round_log2(value):
+    """Return round(log2(value)) for a positive value without evaluating log2.
+
+    ``math.frexp`` splits value into mantissa m in [0.5, 1) and exponent e;
+    log2(value) rounds up to e exactly when m >= sqrt(0.5).
+    """
+    mantissa, exponent = math.frexp(value)
+    return exponent if mantissa >= _SQRT_HALF else exponent - 1
+
+
 def gain_to_log2(gain):
     """Convert gain value to log2 slider value.
 
@@ -153,7 +205,7 @@ def gain_to_log2(gain):
     """
     if gain <= 0:
         return 0
-    return int(round(math.log2(gain)))
+    return _round_log2(gain)
 
 
 def log2_to_gain(log2_value):
@@ -165,7 +217,23 @@ def log2_to_gain(log2_value):
     Returns:
         Gain as power of 2
     """
-    return 2**log2_value
+    return math.ldexp(1.0, log2_value)
+
+
+def nearest_power_of_2_log2(value, log2_min=-7, log2_max=10):
+    """Return the exponent of the nearest power of 2 within range.
+
+    Args:
+        value: Value to round
+        log2_min: Minimum log2 value
+        log2_max: Maximum log2 value
+
+    Returns:
+        Integer exponent (0 for non-positive values)
+    """
+    if value <= 0:
+        return 0
+    return clamp_value(_round_log2(value), log2_min, log2_max)
 
 
 def round_to_power_of_2(value, log2_min=-7, log2_max=10):
@@ -181,11 +249,7 @@ def round_to_power_of_2(value, log2_min=-7, log2_max=10):
     """
     if value <= 0:
         return 1.0
-
-    log2_val = math.log2(value)
-    nearest_log2 = round(log2_val)
-    clamped_log2 = clamp_value(nearest_log2, log2_min, log2_max)
-    return 2**clamped_log2
+    return math.ldexp(1.0, nearest_power_of_2_log2(value, log2_min, log2_max))
 
 
 def format_value_label(value, is_float):
@@ -203,9 +267,12 @@ def format_value_label(value, is_float):
     return f"{int(value)}"
 
 
+@lru_cache(maxsize=64)
 def format_gain_label(gain):
     """Format gain value for display.
 
+    Gains are snapped to a small set of powers of 2, so results are memoized.
+
     Args:
         gain: Gain value
 
@@ -3,7 +3,7 @@ from __future__ import annotations
 from pathlib import Path
 from typing import Any, List
 
-from PySide6.QtCore import Qt, QModelIndex, QEvent
+from PySide6.QtCore import Qt, QModelIndex, QEvent, QTimer, QRegularExpression
 from PySide6.QtGui import QBrush, QColor
 from PySide6.QtWidgets import (
     QDialog,
@@ -22,6 +22,7 @@ from PySide6.QtWidgets import (
     QMenuBar,
     QMenu,
     QScrollArea,
+    QHeaderView,
 )
 
 from ...utils.features_manager import FeaturesManager
@@ -32,16 +33,21 @@ from .widgets import (
     AnnotationsTableModel,
     LoadedOnlyProxyModel,
 )
+from .widgets.tables import resolve_path_str
 
 
 class FeaturesDialog(QDialog):
     # Store position before minimize to restore after showNormal()
     _position_before_minimize = None
+    # Delay (ms) after the last keystroke in the filter box before re-filtering
+    FILTER_DEBOUNCE_MS = 150
 
     def __init__(self, viewer, manager: FeaturesManager):
         super().__init__(viewer)
         self.viewer = viewer
         self.manager = manager
+        # Resolved viewer image path -> index in viewer.images (rebuilt on image changes)
+        self._viewer_path_to_index = {}
 
         # Set window flags to allow minimizing and prevent staying on top
         flags = Qt.Window | Qt.WindowMinimizeButtonHint | Qt.WindowCloseButtonHint
@@ -108,17 +114,7 @@ class FeaturesDialog(QDialog):
         self.table_images.doubleClicked.connect(self._on_double_clicked)
         self.table_images.setSelectionBehavior(QTableView.SelectRows)
         self.table_images.setAlternatingRowColors(True)
-        # Performance-related view hints
-        try:
-            # Use uniform row heights for faster layout/painting when rows are same height
-            self.table_images.setUniformRowHeights(True)
-            # Use pixel scrolling for smoother scrolling on large tables
-            self.table_images.setVerticalScrollMode(QAbstractItemView.ScrollPerPixel)
-            self.table_images.setHorizontalScrollMode(QAbstractItemView.ScrollPerPixel)
-            # Avoid word-wrapping which can force heavy layout work
-            self.table_images.setWordWrap(False)
-        except Exception:
-            pass
+        self._apply_perf_hints(self.table_images)
         # Use plain text delegate to disable spinbox for numeric cells
         self.table_images.setItemDelegate(PlainTextDelegate(self.table_images))
         # Hide vertical header (row numbers)
@@ -148,6 +144,7 @@ class FeaturesDialog(QDialog):
         self.table_categories.setAlternatingRowColors(True)
         self.table_categories.verticalHeader().setVisible(False)
         self.table_categories.setMouseTracking(True)
+        self._apply_perf_hints(self.table_categories)
         w_cat = QWidget(self)
         v_cat = QVBoxLayout(w_cat)
         v_cat.setContentsMargins(0, 0, 0, 0)
@@ -162,6 +159,7 @@ class FeaturesDialog(QDialog):
         self.table_annotations.setAlternatingRowColors(True)
         self.table_annotations.verticalHeader().setVisible(False)
         self.table_annotations.setMouseTracking(True)
+        self._apply_perf_hints(self.table_annotations)
         w_ann = QWidget(self)
         v_ann = QVBoxLayout(w_ann)
         v_ann.setContentsMargins(0, 0, 0, 0)
@@ -170,6 +168,13 @@ class FeaturesDialog(QDialog):
 
         layout.addWidget(self.tabs, 1)
 
+        # Typing restarts this timer so a burst of keystrokes triggers one filter pass
+        self._pending_filter = None  # (proxy, text) waiting for the timer
+        self._filter_timer = QTimer(self)
+        self._filter_timer.setSingleShot(True)
+        self._filter_timer.setInterval(self.FILTER_DEBOUNCE_MS)
+        self._filter_timer.timeout.connect(self._apply_filter_now)
+
         # Wire up
         self.filter_edit.textChanged.connect(self._on_filter_changed)
         self.filter_column.currentIndexChanged.connect(self._on_filter_col_changed)
@@ -178,8 +183,9 @@ class FeaturesDialog(QDialog):
         self.btn_save.clicked.connect(self._on_save)
         self.btn_toggle_cols.clicked.connect(self._on_toggle_columns)
         self.chk_show_loaded_only.toggled.connect(self._on_loaded_only_toggled)
-        # Listen to image change: refresh highlight and re-evaluate loaded-only filter
-        self.viewer.image_changed.connect(self._on_viewer_images_changed)
+        # Listen to image change: re-evaluate loaded-only filter. The model debounces
+        # viewer.image_changed and signals once its loaded/current caches are current.
+        self.model_images.loaded_paths_changed.connect(self._on_viewer_images_changed)
 
         # Initialize filter
         self.refresh_filter_columns()
@@ -190,8 +196,22 @@ class FeaturesDialog(QDialog):
         # Apply canonical initial sorts
         self._apply_initial_sorts()
 
+    @staticmethod
+    def _apply_perf_hints(view: QTableView):
+        """Apply view settings that keep layout and painting cheap on large tables."""
+        # Use pixel scrolling for smoother scrolling on large tables
+        view.setVerticalScrollMode(QAbstractItemView.ScrollPerPixel)
+        view.setHorizontalScrollMode(QAbstractItemView.ScrollPerPixel)
+        # Avoid word-wrapping which can force heavy layout work
+        view.setWordWrap(False)
+        # QTableView has no uniformRowHeights; a fixed-size vertical header gives the
+        # same fast path (row positions are computed, never measured from contents).
+        view.verticalHeader().setSectionResizeMode(QHeaderView.Fixed)
+
     # ----- UI handlers -----
     def refresh_from_manager(self):
+        # Feature files may point at new or moved files; drop memoized resolutions
+        resolve_path_str.cache_clear()
         self.model_images.refresh()
         self.model_categories.refresh()
         self.model_annotations.refresh()
@@ -252,25 +272,27 @@ class FeaturesDialog(QDialog):
         self.filter_column.blockSignals(False)
 
     def refresh_roles(self):
-        r = self.model_images.rowCount()
-        c = self.model_images.columnCount()
-        if r > 0 and c > 0:
-            tl = self.model_images.index(0, 0)
-            br = self.model_images.index(r - 1, c - 1)
-            self.model_images.dataChanged.emit(tl, br, [Qt.DisplayRole, Qt.BackgroundRole, Qt.ForegroundRole])
+        # Repaint just the visible cells; a whole-model dataChanged would make views
+        # and proxies revisit every row. Image changes already signal the affected
+        # rows from the model (FeaturesTableModel._rebuild_loaded_cache).
+        self.table_images.viewport().update()
 
     def _on_viewer_images_changed(self):
-        # Recompute proxy filtering when the set of loaded images changes
+        self._rebuild_viewer_path_index()
+        # Recompute proxy filtering when the set of loaded images changes. Row
+        # filtering is all that depends on it, so column filters are left alone.
+        # The loaded/current highlighting of affected rows is refreshed by the
+        # model itself (FeaturesTableModel._rebuild_loaded_cache).
         try:
-            self.proxy_images.invalidateFilter()
+            self.proxy_images.invalidate_loaded_rows()
+            # Without loaded-only filtering the visible rows don't depend on it
+            if self.chk_show_loaded_only.isChecked():
+                self.proxy_images.invalidateRowsFilter()
         except Exception:
             pass
-        # Refresh roles (loaded/current highlighting)
-        self.refresh_roles()
 
     def _on_loaded_only_toggled(self, checked: bool):
         self.proxy_images.set_loaded_only(checked)
-        self.proxy_images.invalidateFilter()
 
     def _on_open_features(self):
         files, _ = QFileDialog.getOpenFileNames(self, "特徴量ファイルを開く", "", "Feature Files (*.json *.csv)")
@@ -377,8 +399,27 @@ class FeaturesDialog(QDialog):
             QMessageBox.critical(self, "保存エラー", str(e))
 
     def _on_filter_changed(self, text: str):
-        proxy = self._current_proxy()
-        proxy.setFilterFixedString(text)
+        # Remember the proxy now so a tab switch before the timer fires doesn't retarget the text
+        self._pending_filter = (self._current_proxy(), text)
+        self._filter_timer.start()
+
+    def _apply_filter_now(self):
+        if self._pending_filter is None:
+            return
+        proxy, text = self._pending_filter
+        self._pending_filter = None
+        if proxy is self.proxy_images:
+            # LoadedOnlyProxyModel matches fixed strings against cached, casefolded column text
+            proxy.setFilterFixedString(text)
+            return
+        if not text:
+            proxy.setFilterRegularExpression(QRegularExpression())
+            return
+        # Same match as a case-insensitive fixed string, but compiled once up front
+        # instead of lazily on the first row the proxy tests.
+        qre = QRegularExpression(QRegularExpression.escape(text), QRegularExpression.CaseInsensitiveOption)
+        qre.optimize()
+        proxy.setFilterRegularExpression(qre)
 
     def _on_filter_col_changed(self):
         proxy = self._current_proxy()
@@ -415,12 +456,8 @@ class FeaturesDialog(QDialog):
         if not p.exists():
             QMessageBox.information(self, "画像を開く", "ファイルが存在しません。")
             return
-        match_idx = None
         try:
-            for i, info in enumerate(self.viewer.images):
-                if Path(info.get("path", "")).resolve() == p.resolve():
-                    match_idx = i
-                    break
+            match_idx = self._viewer_index_for_path(resolve_path_str(str(p)))
         except Exception:
             match_idx = None
 
@@ -437,6 +474,26 @@ class FeaturesDialog(QDialog):
         except Exception as e:
             QMessageBox.critical(self, "画像を開く", f"読み込みに失敗しました:\n{e}")
 
+    def _rebuild_viewer_path_index(self):
+        index = {}
+        for i, info in enumerate(getattr(self.viewer, "images", None) or []):
+            try:
+                # First occurrence wins, matching a front-to-back scan
+                index.setdefault(resolve_path_str(str(info.get("path", ""))), i)
+            except Exception:
+                continue
+        self._viewer_path_to_index = index
+
+    def _viewer_index_for_path(self, resolved: str):
+        """Return the viewer.images index of an already-resolved path, or None."""
+        idx = self._viewer_path_to_index.get(resolved)
+        images = self.viewer.images
+        if idx is None or idx >= len(images) or resolve_path_str(str(images[idx].get("path", ""))) != resolved:
+            # Images may have changed without an image_changed signal; rebuild once
+            self._rebuild_viewer_path_index()
+            idx = self._viewer_path_to_index.get(resolved)
+        return idx
+
     # Helpers for current tab
     def _current_proxy(self):
         i = self.tabs.currentIndex()
@@ -2,7 +2,29 @@ from PySide6.QtWidgets import QStyledItemDelegate, QLineEdit
 
 
 class PlainTextDelegate(QStyledItemDelegate):
-    """Delegate that always uses a plain QLineEdit for editing (no spinbox)."""
+    """Delegate that always uses a plain QLineEdit for editing (no spinbox).
+
+    Closed editors are kept in a small pool and reused for the next edit
+    instead of allocating a new QLineEdit per cell.
+    """
+
+    POOL_SIZE = 4
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self._pool = []  # idle QLineEdit editors, parentless and hidden
 
     def createEditor(self, parent, option, index):
+        if self._pool:
+            editor = self._pool.pop()
+            editor.setParent(parent)
+            return editor
         return QLineEdit(parent)
+
+    def destroyEditor(self, editor, index):
+        if isinstance(editor, QLineEdit) and len(self._pool) < self.POOL_SIZE:
+            editor.clear()
+            editor.setParent(None)
+            self._pool.append(editor)
+            return
+        super().destroyEditor(editor, index)
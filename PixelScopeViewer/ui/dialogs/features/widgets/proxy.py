@@ -1,46 +1,120 @@
-from PySide6.QtCore import QSortFilterProxyModel, QModelIndex, Qt
-from pathlib import Path
+from PySide6.QtCore import Qt, QSortFilterProxyModel, QModelIndex, QRegularExpression
+
+from .tables import simple_casefold
 
 
 class LoadedOnlyProxyModel(QSortFilterProxyModel):
-    """Proxy model that can filter to show only loaded images."""
+    """Proxy model that can filter to show only loaded images.
+
+    The set of source rows that pass the loaded-only check is computed once
+    (lazily, after ``invalidate_loaded_rows()``) as a byte mask, so
+    ``filterAcceptsRow`` is an index lookup instead of a per-row path resolution. While no filter text is
+    set, the base class's pattern match is skipped entirely; a case-insensitive
+    fixed string is matched against the source model's cached ``filter_texts()``
+    instead of running the regular expression per row.
+    """
 
     def __init__(self, parent=None):
         super().__init__(parent)
         self._loaded_only = False
+        # Accept mask by source row for the loaded-only filter (1 = accept);
+        # None means accept all
+        self._loaded_rows = None
+        self._loaded_rows_stale = True
+        # True while a non-empty filter pattern is set
+        self._text_filter_active = False
+        # Fixed-string filter as given (None unless set via setFilterFixedString) and its
+        # casefolded form for the fast substring path (None when that path does not apply)
+        self._fixed_pattern = None
+        self._needle = None
+
+    def setSourceModel(self, model):
+        old = self.sourceModel()
+        if old is not None:
+            try:
+                old.modelAboutToBeReset.disconnect(self.invalidate_loaded_rows)
+            except (RuntimeError, TypeError):
+                pass
+        super().setSourceModel(model)
+        if model is not None:
+            # Row indices change on reset; recompute on the next filter pass
+            model.modelAboutToBeReset.connect(self.invalidate_loaded_rows)
+        self.invalidate_loaded_rows()
+
+    # The base setters re-run the filter synchronously, so the flag is updated first.
+    def setFilterFixedString(self, pattern):
+        self._text_filter_active = bool(pattern)
+        self._fixed_pattern = pattern
+        self._update_needle(self.filterCaseSensitivity())
+        super().setFilterFixedString(pattern)
+
+    def setFilterWildcard(self, pattern):
+        self._text_filter_active = bool(pattern)
+        self._fixed_pattern = self._needle = None
+        super().setFilterWildcard(pattern)
+
+    def setFilterRegularExpression(self, pattern):
+        text = pattern.pattern() if isinstance(pattern, QRegularExpression) else pattern
+        self._text_filter_active = bool(text)
+        self._fixed_pattern = self._needle = None
+        super().setFilterRegularExpression(pattern)
+
+    def setFilterCaseSensitivity(self, cs):
+        self._update_needle(cs)
+        super().setFilterCaseSensitivity(cs)
+
+    def _update_needle(self, cs):
+        pattern = self._fixed_pattern
+        if pattern and cs == Qt.CaseInsensitive:
+            self._needle = simple_casefold(pattern)
+        else:
+            self._needle = None
 
     def set_loaded_only(self, enabled: bool):
+        """Enable/disable the loaded-only filter, re-filtering only on an actual change."""
+        if enabled == self._loaded_only:
+            return
         self._loaded_only = enabled
+        self.invalidate_loaded_rows()
+        self.invalidateRowsFilter()
 
-    def filterAcceptsRow(self, source_row: int, source_parent: QModelIndex) -> bool:
-        if not super().filterAcceptsRow(source_row, source_parent):
-            return False
-        # If not filtering by loaded-only, accept all rows
-        if not self._loaded_only:
-            return True
+    def invalidate_loaded_rows(self):
+        """Mark the loaded-row set stale (call when loaded images or rows change)."""
+        self._loaded_rows_stale = True
+
+    def rebuild_loaded_rows(self):
+        """Recompute which source rows are loaded in the viewer.
 
+        Rows without a filepath are always accepted. When the source model
+        has no loaded-path cache, or nothing is loaded, all rows are accepted.
+        """
+        self._loaded_rows = None
+        self._loaded_rows_stale = False
         try:
             src = self.sourceModel()
             # The source model must have a `_loaded_paths` cache for this to work.
             loaded_paths = getattr(src, "_loaded_paths", None)
-            if loaded_paths is None:
-                # If the model doesn't support our expected cache, accept the row
-                # to avoid incorrectly hiding it.
-                return True
-
-            # If there are no loaded images at all, show all rows.
-            if not loaded_paths:
-                return True
-
-            fp = src.manager.get_value(source_row, "fullfilepath")
-            if not fp:
-                # If there's no filepath, we can't determine if it's loaded,
-                # so we don't filter it out.
-                return True
-
-            p = str(Path(str(fp)).resolve())
-            return p in loaded_paths
+            row_paths = getattr(src, "row_resolved_paths", None)
+            if not loaded_paths or row_paths is None:
+                return
+            self._loaded_rows = bytes(p is None or p in loaded_paths for p in row_paths())
         except Exception:
-            # On any error, accept the row to be safe.
-            pass
-        return True
+            # On any error, accept all rows to be safe.
+            self._loaded_rows = None
+
+    def filterAcceptsRow(self, source_row: int, source_parent: QModelIndex) -> bool:
+        if self._loaded_only:
+            if self._loaded_rows_stale:
+                self.rebuild_loaded_rows()
+            if self._loaded_rows is not None and not self._loaded_rows[source_row]:
+                return False
+        if not self._text_filter_active:
+            return True
+        col = self.filterKeyColumn()
+        if self._needle is not None and col >= 0:
+            filter_texts = getattr(self.sourceModel(), "filter_texts", None)
+            if filter_texts is not None:
+                text = filter_texts(col)[source_row]
+                if text is not None:
+                    return self._needle in text
+        return super().filterAcceptsRow(source_row, source_parent)
@@ -1,41 +1,195 @@
 from __future__ import annotations
 
-from pathlib import Path
+import operator
+import os
+import sys
+from functools import lru_cache
 from typing import Any, List
 
-from PySide6.QtCore import Qt, QAbstractTableModel, QModelIndex
+from PySide6.QtCore import Qt, QAbstractTableModel, QLocale, QModelIndex, QTimer, Signal
 from PySide6.QtGui import QBrush, QColor
 from PySide6.QtCore import QSortFilterProxyModel
 
 from ....utils.features_manager import FeaturesManager
 
+# Shared, immutable role values returned from data(); built once instead of per cell
+_BRUSH_LOADED = QBrush(QColor("black"))
+_BRUSH_NOT_LOADED = QBrush(QColor("gray"))
+_BRUSH_CURRENT = QBrush(QColor(255, 255, 200))
+_ALIGN_RIGHT = Qt.AlignRight | Qt.AlignVCenter
+_ALIGN_LEFT = Qt.AlignLeft | Qt.AlignVCenter
+# Roles the table models answer; data() returns None for anything else before
+# reading the cell value (views also query size hint, font, decoration, ...).
+_HOT_ROLES = frozenset(
+    {Qt.DisplayRole, Qt.EditRole, Qt.TextAlignmentRole, Qt.ToolTipRole, Qt.ForegroundRole, Qt.BackgroundRole}
+)
+# Exact cell types that are never summarized as sequences; checked before the
+# generic (and much slower) isinstance/hasattr("__len__") probe.
+_PLAIN_TYPES = frozenset({int, float, bool, str, bytes, bytearray, dict})
+_C_LOCALE = QLocale.c()
+
+
+def simple_casefold(text: str) -> str | None:
+    """Casefold ``text`` the way Qt's case-insensitive matching does, or return None if that differs.
+
+    Qt uses simple (one-to-one) case folding; ``str.casefold()`` agrees with it
+    unless some character expands to several (e.g. "ß" -> "ss").
+    """
+    folded = text.casefold()
+    return folded if len(folded) == len(text) else None
+
+
+def _filter_text(value) -> str | None:
+    """Return the casefolded text Qt's filter would match for a display value.
+
+    Floats are formatted like QVariant's string conversion ("20", not "20.0").
+    Returns None for values whose Qt text is not derived here; callers fall back
+    to Qt's own matching for those.
+    """
+    kind = type(value)
+    if kind is str:
+        return simple_casefold(value)
+    if kind is bool:
+        return "true" if value else "false"
+    if kind is int:
+        return str(value)
+    if kind is float:
+        return _C_LOCALE.toString(value, "g", QLocale.FloatingPointShortest).lower()
+    return None
+
+
+def _uniform_alignment(values) -> Qt.Alignment | None:
+    """Return the alignment shared by every value of a column, or None if it varies per cell.
+
+    Numbers are right-aligned and everything else (including None) left-aligned.
+    """
+    kinds = {isinstance(v, (int, float)) for v in values}
+    if kinds == {True}:
+        return _ALIGN_RIGHT
+    if True not in kinds:
+        return _ALIGN_LEFT
+    return None
+
+
+@lru_cache(maxsize=1 << 16)
+def resolve_path_str(path: str) -> str:
+    """Return the canonical absolute form of ``path`` (same result as ``str(Path(path).resolve())``).
+
+    Uses ``os.path.realpath`` directly, which is what ``Path.resolve()`` does underneath, without
+    building intermediate Path objects. Memoized to avoid repeated filesystem lookups; call
+    ``resolve_path_str.cache_clear()`` when files may have moved (e.g. after reloading features).
+    """
+    # Interned so membership tests against interned row paths hit on identity
+    return sys.intern(os.path.realpath(path))
+
 
 class FeaturesTableModel(QAbstractTableModel):
+    # Emitted after the loaded/current path caches were rebuilt for a viewer image change
+    loaded_paths_changed = Signal()
+
+    # Bursts of viewer.image_changed within this interval (ms) share one cache rebuild
+    LOADED_CACHE_DEBOUNCE_MS = 25
+
     def __init__(self, viewer, manager: FeaturesManager):
         super().__init__()
         self.viewer = viewer
         self.manager = manager
         self._columns = self.manager.get_columns()
+        self._col_flags = self._build_column_flags()
+        # Row dicts in display order, captured per reset. manager.get_value() copies
+        # the whole row list on every call, which is too slow for per-cell reads.
+        self._rows = self.manager.get_rows()
         # Cache resolved loaded image paths and current image path to avoid
         # repeated expensive resolution/loops during painting.
-        self._loaded_paths = set()
+        self._loaded_paths = frozenset()
         self._current_path = None
+        # Resolved fullfilepath by source row (None if missing); built on first
+        # use and dropped whenever the rows are reset.
+        self._row_paths: List[str | None] | None = None
+        # Foreground brush by source row; built on first use, dropped when the rows
+        # or the loaded paths change.
+        self._row_foreground: List[QBrush] | None = None
+        # Column index -> alignment shared by the whole column (None: decide per cell);
+        # filled on first use and cleared whenever the rows are reset.
+        self._col_align = {}
+        # Column index -> casefolded display text of every row, for substring
+        # filtering; filled on first use and cleared whenever values may change.
+        self._filter_texts = {}
+        # data() dispatches on role through this table; unlisted roles return None
+        # without touching the manager.
+        self._role_handlers = {
+            Qt.DisplayRole: self._h_display,
+            Qt.EditRole: self._h_display,
+            Qt.TextAlignmentRole: self._h_align,
+            Qt.ToolTipRole: self._h_tip,
+            Qt.ForegroundRole: self._h_fg,
+            Qt.BackgroundRole: self._h_bg,
+        }
+        self._rebuild_timer = QTimer(self)
+        self._rebuild_timer.setSingleShot(True)
+        self._rebuild_timer.setInterval(self.LOADED_CACHE_DEBOUNCE_MS)
+        self._rebuild_timer.timeout.connect(self._rebuild_loaded_cache)
         try:
             # viewer exposes a signal 'image_changed' (used elsewhere); listen
-            # to rebuild our caches when images change.
-            self.viewer.image_changed.connect(self._rebuild_loaded_cache)
+            # to rebuild our caches when images change. Each signal restarts the
+            # timer, so batch loads and fast navigation rebuild once.
+            self.viewer.image_changed.connect(self._rebuild_timer.start)
         except Exception:
             pass
         # Build initial cache
         self._rebuild_loaded_cache()
 
     def refresh(self):
+        columns = self.manager.get_columns()
+        rows = self.manager.get_rows()
+        if columns == self._columns and len(rows) == len(self._rows) and all(map(operator.is_, rows, self._rows)):
+            # Same columns and the very same row dicts: only values can have changed
+            # (edited in place), so keep proxy sort/filter/selection state and just
+            # tell views to re-read the cells.
+            self._col_align.clear()
+            self._filter_texts.clear()
+            if rows and columns:
+                self.dataChanged.emit(self.index(0, 0), self.index(len(rows) - 1, len(columns) - 1))
+            return
         self.beginResetModel()
-        self._columns = self.manager.get_columns()
+        self._columns = columns
+        self._col_flags = self._build_column_flags()
+        self._rows = rows
+        self._row_paths = None
+        self._row_foreground = None
+        self._col_align.clear()
+        self._filter_texts.clear()
         self.endResetModel()
 
     def rowCount(self, parent: QModelIndex = QModelIndex()) -> int:
-        return 0 if parent.isValid() else self.manager.row_count()
+        return 0 if parent.isValid() else len(self._rows)
+
+    def _row_resolved_path(self, row: int) -> str | None:
+        """Return the resolved fullfilepath of a row.
+
+        FeaturesManager stores ``fullfilepath`` already resolved (it is the row key),
+        so no filesystem lookup is needed here.
+        """
+        return self.row_resolved_paths()[row]
+
+    def row_resolved_paths(self) -> List[str | None]:
+        """Return the resolved fullfilepath of every row, indexed by source row (built once per reset)."""
+        paths = self._row_paths
+        if paths is None:
+            values = (r.get("fullfilepath") for r in self._rows)
+            paths = self._row_paths = [sys.intern(str(fp)) if fp else None for fp in values]
+        return paths
+
+    def filter_texts(self, col: int) -> List[str | None]:
+        """Return the casefolded display text of column ``col`` for every row (built once per change).
+
+        Entries are None where the text is left to Qt (see ``_filter_text``).
+        """
+        texts = self._filter_texts.get(col)
+        if texts is None:
+            display = self._h_display
+            texts = self._filter_texts[col] = [_filter_text(display(row, col)) for row in range(len(self._rows))]
+        return texts
 
     def columnCount(self, parent: QModelIndex = QModelIndex()) -> int:
         return 0 if parent.isValid() else len(self._columns)
@@ -53,81 +207,85 @@ class FeaturesTableModel(QAbstractTableModel):
     def data(self, index: QModelIndex, role: int = Qt.DisplayRole) -> Any:
         if not index.isValid():
             return None
-        row = index.row()
-        col = index.column()
-        col_name = self._columns[col]
-        value = self.manager.get_value(row, col_name)
-
-        if role == Qt.DisplayRole or role == Qt.EditRole:
-            # Avoid returning huge literal strings/arrays to the view; instead
-            # return small summaries for long sequences/arrays to keep painting
-            # cheap. For small values, return as-is.
-            if value is None:
-                return ""
-            # If value is a sequence-like (but not string/dict/bytes), summarize
-            try:
-                if not isinstance(value, (str, bytes, bytearray, dict)) and hasattr(value, "__len__"):
-                    length = len(value)
-                    if length > 20:
-                        return f"<{type(value).__name__} len={length}>"
-            except Exception:
-                # Fall back to returning the raw value if any check fails
-                pass
+        handler = self._role_handlers.get(role)
+        return handler(index.row(), index.column()) if handler is not None else None
+
+    # ---- per-role data handlers (dispatched from data() via _role_handlers) ----
+    def _h_display(self, row: int, col: int) -> Any:
+        # Avoid returning huge literal strings/arrays to the view; instead
+        # return small summaries for long sequences/arrays to keep painting
+        # cheap. For small values, return as-is.
+        value = self._rows[row].get(self._columns[col])
+        if value is None:
+            return ""
+        if type(value) in _PLAIN_TYPES:
             return value
+        # If value is a sequence-like (but not string/dict/bytes), summarize
+        try:
+            if not isinstance(value, (str, bytes, bytearray, dict)) and hasattr(value, "__len__"):
+                length = len(value)
+                if length > 20:
+                    return f"<{type(value).__name__} len={length}>"
+        except Exception:
+            # Fall back to returning the raw value if any check fails
+            pass
+        return value
 
-        if role == Qt.TextAlignmentRole:
-            if isinstance(value, (int, float)):
-                return Qt.AlignRight | Qt.AlignVCenter
-            return Qt.AlignLeft | Qt.AlignVCenter
-
-        if role == Qt.ToolTipRole:
-            # Avoid generating huge tooltip strings for long sequences.
-            if value is None:
-                return None
+    def _h_align(self, row: int, col: int) -> Any:
+        try:
+            align = self._col_align[col]
+        except KeyError:
+            name = self._columns[col]
+            align = self._col_align[col] = _uniform_alignment(r.get(name) for r in self._rows)
+        if align is not None:
+            return align
+        value = self._rows[row].get(self._columns[col])
+        if isinstance(value, (int, float)):
+            return _ALIGN_RIGHT
+        return _ALIGN_LEFT
+
+    def _h_tip(self, row: int, col: int) -> Any:
+        # Avoid generating huge tooltip strings for long sequences.
+        value = self._rows[row].get(self._columns[col])
+        if value is None:
+            return None
+        if type(value) not in _PLAIN_TYPES:
             try:
                 if not isinstance(value, (str, bytes, bytearray, dict)) and hasattr(value, "__len__"):
                     l = len(value)
                     if l > 100:
                         return f"<{type(value).__name__} len={l}>"
             except Exception:
+                # e.g. 0-d numpy arrays expose __len__ but raise on len()
                 pass
-            s = str(value).strip()
-            return s if s else None
-
-        if role == Qt.ForegroundRole:
-            fp = self.manager.get_value(row, "fullfilepath")
-            try:
-                if not fp:
-                    return QBrush(QColor("gray"))
-                p = str(Path(str(fp)).resolve())
-                is_loaded = p in self._loaded_paths
-            except Exception:
-                is_loaded = False
-            return QBrush(QColor("black" if is_loaded else "gray"))
-
-        if role == Qt.BackgroundRole:
-            try:
-                fp = self.manager.get_value(row, "fullfilepath")
-                if fp and self._current_path is not None:
-                    try:
-                        if str(Path(str(fp)).resolve()) == self._current_path:
-                            return QBrush(QColor(255, 255, 200))
-                    except Exception:
-                        pass
-            except Exception:
-                pass
-            return None
-
+        s = str(value).strip()
+        return s if s else None
+
+    def _h_fg(self, row: int, col: int) -> Any:
+        if not self._loaded_paths:
+            return _BRUSH_NOT_LOADED
+        brushes = self._row_foreground
+        if brushes is None:
+            loaded = self._loaded_paths
+            brushes = self._row_foreground = [
+                _BRUSH_LOADED if p is not None and p in loaded else _BRUSH_NOT_LOADED for p in self.row_resolved_paths()
+            ]
+        return brushes[row]
+
+    def _h_bg(self, row: int, col: int) -> Any:
+        if self._current_path is not None and self._row_resolved_path(row) == self._current_path:
+            return _BRUSH_CURRENT
         return None
 
     def flags(self, index: QModelIndex) -> Qt.ItemFlags:
         if not index.isValid():
             return Qt.ItemIsEnabled
-        col_name = self._columns[index.column()]
-        flags = Qt.ItemIsSelectable | Qt.ItemIsEnabled | Qt.ItemIsDragEnabled
-        if self.manager.column_is_editable(col_name):
-            flags |= Qt.ItemIsEditable
-        return flags
+        return self._col_flags[index.column()]
+
+    def _build_column_flags(self) -> List[Qt.ItemFlags]:
+        """Item flags per column; editability is a column property, so flags() needs no manager call."""
+        base = Qt.ItemIsSelectable | Qt.ItemIsEnabled | Qt.ItemIsDragEnabled
+        return [base | Qt.ItemIsEditable if self.manager.column_is_editable(c) else base for c in self._columns]
 
     def setData(self, index: QModelIndex, value: Any, role: int = Qt.EditRole) -> bool:
         if not index.isValid() or role != Qt.EditRole:
@@ -147,6 +305,9 @@ class FeaturesTableModel(QAbstractTableModel):
                 return False
 
         self.manager.set_value(index.row(), col_name, value)
+        # The edit may change the column's value types and text
+        self._col_align.pop(index.column(), None)
+        self._filter_texts.pop(index.column(), None)
         self.dataChanged.emit(index, index, [Qt.DisplayRole, Qt.EditRole])
         return True
 
@@ -154,40 +315,62 @@ class FeaturesTableModel(QAbstractTableModel):
     def _rebuild_loaded_cache(self):
         """Rebuild cached sets for loaded images and current image path.
 
-        This is triggered on viewer.image_changed to avoid per-cell loops.
+        This is triggered (debounced) on viewer.image_changed to avoid per-cell loops.
         """
         loaded = set()
         cur_path = None
         try:
             imgs = getattr(self.viewer, "images", None) or []
-            for info in imgs:
-                try:
-                    p = Path(info.get("path", "")).resolve()
-                    loaded.add(str(p))
-                except Exception:
-                    continue
+            try:
+                # One comprehension pass; resolve_path_str is memoized, so already
+                # seen images cost a cache hit instead of a filesystem lookup.
+                loaded = {resolve_path_str(str(info.get("path", ""))) for info in imgs}
+            except Exception:
+                # Some entry is unusable; fall back to skipping bad entries one by one
+                loaded = set()
+                for info in imgs:
+                    try:
+                        loaded.add(resolve_path_str(str(info.get("path", ""))))
+                    except Exception:
+                        continue
             if getattr(self.viewer, "current_index", None) is not None:
                 try:
                     ci = self.viewer.current_index
                     cur = imgs[ci] if 0 <= ci < len(imgs) else None
                     if cur:
-                        cur_path = str(Path(cur.get("path", "")).resolve())
+                        cur_path = resolve_path_str(str(cur.get("path", "")))
                 except Exception:
                     cur_path = None
         except Exception:
             pass
-        self._loaded_paths = loaded
+        # Only rows whose loaded state or current-image highlight flips need repainting
+        changed = {self._current_path, cur_path}
+        changed.update(self._loaded_paths ^ loaded)
+        changed.discard(None)
+        self._loaded_paths = frozenset(loaded)
         self._current_path = cur_path
+        self._row_foreground = None
         # Notify views that visual roles may have changed
         try:
-            r = self.rowCount()
             c = self.columnCount()
-            if r > 0 and c >= 0:
-                tl = self.index(0, 0)
-                br = self.index(r - 1, c - 1) if r > 0 and c > 0 else tl
-                self.dataChanged.emit(tl, br, [Qt.BackgroundRole, Qt.ForegroundRole])
+            if changed and c > 0:
+                rows = [row for row, p in enumerate(self.row_resolved_paths()) if p in changed]
+                self._emit_rows_changed(rows, [Qt.BackgroundRole, Qt.ForegroundRole])
         except Exception:
             pass
+        self.loaded_paths_changed.emit()
+
+    def _emit_rows_changed(self, rows: List[int], roles: List[int]):
+        """Emit dataChanged for the given sorted rows, one signal per contiguous run."""
+        last_col = self.columnCount() - 1
+        start = prev = None
+        for row in rows + [None]:
+            if start is not None and (row is None or row != prev + 1):
+                self.dataChanged.emit(self.index(start, 0), self.index(prev, last_col), roles)
+                start = None
+            if start is None:
+                start = row
+            prev = row
 
 
 class SimpleDictTableModel(QAbstractTableModel):
@@ -197,22 +380,33 @@ class SimpleDictTableModel(QAbstractTableModel):
         self._cols_fn = cols_fn
         self._editable = editable
         self._columns = self._cols_fn() or []
+        # Snapshot of rows_fn(), re-read only on refresh()/invalidate_rows()
+        self._rows_cache = self._rows_fn() or []
         self.proxy: QSortFilterProxyModel | None = None
 
     def as_proxy(self, parent) -> QSortFilterProxyModel:
         proxy = QSortFilterProxyModel(parent)
         proxy.setSourceModel(self)
         proxy.setFilterCaseSensitivity(Qt.CaseInsensitive)
+        # Sorting is re-applied explicitly after each refresh (FeaturesDialog._apply_initial_sorts)
+        proxy.setDynamicSortFilter(False)
         self.proxy = proxy
         return proxy
 
     def refresh(self):
         self.beginResetModel()
         self._columns = self._cols_fn() or []
+        self._rows_cache = self._rows_fn() or []
+        self.endResetModel()
+
+    def invalidate_rows(self):
+        """Re-read rows after the underlying data changed outside refresh()."""
+        self.beginResetModel()
+        self._rows_cache = self._rows_fn() or []
         self.endResetModel()
 
     def rowCount(self, parent: QModelIndex = QModelIndex()) -> int:
-        return 0 if parent.isValid() else len(self._rows_fn() or [])
+        return 0 if parent.isValid() else len(self._rows_cache)
 
     def columnCount(self, parent: QModelIndex = QModelIndex()) -> int:
         return 0 if parent.isValid() else len(self._columns)
@@ -228,18 +422,17 @@ class SimpleDictTableModel(QAbstractTableModel):
         return None
 
     def data(self, index: QModelIndex, role: int = Qt.DisplayRole):
-        if not index.isValid():
+        if role not in _HOT_ROLES or not index.isValid():
             return None
-        rows = self._rows_fn() or []
         row = index.row()
         col_name = self._columns[index.column()]
-        value = rows[row].get(col_name)
+        value = self._rows_cache[row].get(col_name)
         if role == Qt.DisplayRole:
             return value
         if role == Qt.TextAlignmentRole:
             if isinstance(value, (int, float)):
-                return Qt.AlignRight | Qt.AlignVCenter
-            return Qt.AlignLeft | Qt.AlignVCenter
+                return _ALIGN_RIGHT
+            return _ALIGN_LEFT
         if role == Qt.ToolTipRole:
             if value is not None and str(value).strip():
                 return str(value)
@@ -259,24 +452,57 @@ class AnnotationsTableModel(QAbstractTableModel):
         super().__init__()
         self.manager = manager
         self._columns = ["image_id", "category_id", "bbox_x", "bbox_y", "bbox_w", "bbox_h"]
+        # get_annotations_rows() copies the list; keep one snapshot per refresh()
+        self._rows_cache = self.manager.get_annotations_rows()
+        # Column-major cell values (one list per entry of _columns), each built on
+        # first access and dropped with the snapshot
+        self._column_values: List[List[Any] | None] = [None] * len(self._columns)
+        # Alignment shared by each built column (None: decide per cell)
+        self._column_aligns: List[Any] = [None] * len(self._columns)
         self.proxy: QSortFilterProxyModel | None = None
 
     def as_proxy(self, parent) -> QSortFilterProxyModel:
         proxy = QSortFilterProxyModel(parent)
         proxy.setSourceModel(self)
         proxy.setFilterCaseSensitivity(Qt.CaseInsensitive)
+        # Sorting is re-applied explicitly after each refresh (FeaturesDialog._apply_initial_sorts)
+        proxy.setDynamicSortFilter(False)
         self.proxy = proxy
         return proxy
 
     def refresh(self):
         self.beginResetModel()
+        self._rows_cache = self.manager.get_annotations_rows()
+        self._column_values = [None] * len(self._columns)
         self.endResetModel()
 
+    def invalidate_rows(self):
+        """Re-read rows after the manager's annotations changed outside refresh()."""
+        self.refresh()
+
     def get_columns(self) -> List[str]:
         return list(self._columns)
 
+    def _column(self, col: int) -> List[Any]:
+        """Return the value list of one column, extracting it from the rows on first use."""
+        values = self._column_values[col]
+        if values is None:
+            name = self._columns[col]
+            rows = self._rows_cache
+            if name.startswith("bbox_"):
+                i = ("bbox_x", "bbox_y", "bbox_w", "bbox_h").index(name)
+                values = []
+                for a in rows:
+                    bbox = a.get("bbox") or ()
+                    values.append(bbox[i] if i < len(bbox) else None)
+            else:
+                values = [a.get(name) for a in rows]
+            self._column_values[col] = values
+            self._column_aligns[col] = _uniform_alignment(values)
+        return values
+
     def rowCount(self, parent: QModelIndex = QModelIndex()) -> int:
-        return 0 if parent.isValid() else len(self.manager.get_annotations_rows())
+        return 0 if parent.isValid() else len(self._rows_cache)
 
     def columnCount(self, parent: QModelIndex = QModelIndex()) -> int:
         return 0 if parent.isValid() else len(self._columns)
@@ -292,26 +518,18 @@ class AnnotationsTableModel(QAbstractTableModel):
         return None
 
     def data(self, index: QModelIndex, role: int = Qt.DisplayRole):
-        if not index.isValid():
+        if role not in _HOT_ROLES or not index.isValid():
             return None
-        row = index.row()
-        a = self.manager.get_annotations_rows()[row]
-        col = self._columns[index.column()]
-
-        value = None
-        if col == "image_id":
-            value = a.get("image_id")
-        elif col == "category_id":
-            value = a.get("category_id")
-        elif col.startswith("bbox_"):
-            i = {"bbox_x": 0, "bbox_y": 1, "bbox_w": 2, "bbox_h": 3}[col]
-            bbox = a.get("bbox") or [None, None, None, None]
-            value = bbox[i]
+        col = index.column()
+        value = self._column(col)[index.row()]
 
         if role == Qt.DisplayRole:
             return value
         if role == Qt.TextAlignmentRole:
+            align = self._column_aligns[col]
+            if align is not None:
+                return align
             if isinstance(value, (int, float)):
-                return Qt.AlignRight | Qt.AlignVCenter
-            return Qt.AlignLeft | Qt.AlignVCenter
+                return _ALIGN_RIGHT
+            return _ALIGN_LEFT
         return None
@@ -103,7 +103,7 @@ def create_menus(viewer):
 
     # Help menu
     help_menu = menubar.addMenu("ヘルプ")
-    help_menu.addAction(QAction("ヘルプ / ショートカット", viewer, triggered=viewer.help_dialog.show))
+    help_menu.addAction(QAction("ヘルプ / ショートカット", viewer, triggered=viewer.show_help_dialog))
 
     # Add global application-level shortcuts
     _create_global_shortcuts(viewer)
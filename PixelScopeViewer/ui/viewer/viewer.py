@@ -197,7 +197,7 @@ class ImageViewer(QMainWindow):
         right_layout.addWidget(self.status_scale)
         self.status.addPermanentWidget(right_container)
 
-        self.help_dialog = HelpDialog(self)
+        self.help_dialog = None  # Will be created when first shown
         self.brightness_dialog = None  # Will be created when needed
 
         # Initialize managers
@@ -246,6 +246,14 @@ class ImageViewer(QMainWindow):
     def apply_brightness_adjustment(self, arr: np.ndarray) -> np.ndarray:
         return self.brightness_manager.apply_brightness_adjustment(arr)
 
+    def show_help_dialog(self):
+        """Show the help dialog, creating it on first use and reusing it afterwards."""
+        if self.help_dialog is None:
+            self.help_dialog = HelpDialog(self)
+        self.help_dialog.show()
+        self.help_dialog.raise_()
+        self.help_dialog.activateWindow()
+
     # Delegate status update methods to status_updater
     def update_mouse_status(self, pos):
         self.status_updater.update_mouse_status(pos)